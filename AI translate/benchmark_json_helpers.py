@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the flatten/unflatten core in json_helpers.
+
+Builds synthetic nested catalogs of increasing size, then reports the time
+per key of flatten_json / unflatten_json (which should stay flat as the
+catalog grows) and the memory a second locale adds on top of the first
+(one dict entry per key: the key strings themselves are shared).
+
+Usage:
+    python benchmark_json_helpers.py                  # 10k .. 200k keys
+    python benchmark_json_helpers.py --sizes 1000 500000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from json_helpers import flatten_json, unflatten_json
+
+
+def build_catalog(size: int, locale: str, fanout: int = 20) -> dict:
+    """Nested catalog of `size` leaves, 4 levels deep, with a few non-string values."""
+    catalog: dict = {}
+    for i in range(size):
+        a, b, c = i // (fanout ** 2), (i // fanout) % fanout, i % fanout
+        section = catalog.setdefault(f"section{a}", {}).setdefault(f"group{b}", {})
+        if i % 500 == 0:
+            section[f"key{c}"] = [i, f"{locale} item {i}"]
+        elif i % 501 == 0:
+            section[f"key{c}"] = i
+        else:
+            section[f"key{c}"] = f"{locale} string number {i} with {{placeholder}}"
+    return catalog
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(size: int) -> None:
+    source = build_catalog(size, "en")
+    target = build_catalog(size, "xx")
+
+    # The first catalog registers the key paths, later ones reuse them
+    source_flat, t_first = timed(flatten_json, source)
+    _, t_next = timed(flatten_json, target)
+    rebuilt, t_unflatten = timed(unflatten_json, source_flat)
+    _, t_ordered = timed(unflatten_json, source_flat, source_order=True)
+    assert rebuilt == source, "round trip is not lossless"
+
+    # Memory added by flattening another locale with the same keys
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    target_flat = flatten_json(target)
+    added = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    shared = sum(1 for a, b in zip(source_flat, target_flat) if a is b)
+
+    print(f"{size:>8} | {t_first * 1e6 / size:>9.2f} | {t_next * 1e6 / size:>9.2f} | "
+          f"{t_unflatten * 1e6 / size:>9.2f} | {t_ordered * 1e6 / size:>9.2f} | "
+          f"{added / size:>9.1f} | {shared == size}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark json_helpers flatten/unflatten")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000, 200_000])
+    args = parser.parse_args()
+
+    print("Times in µs per key; memory in bytes per key added by each extra locale.")
+    print(f"{'keys':>8} | {'flat 1st':>9} | {'flat next':>9} | {'unflatten':>9} | "
+          f"{'ordered':>9} | {'B/key':>9} | shared keys")
+    print("-" * 80)
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Record/replay cassettes for the AI Translation Tool.
+
+A cassette stores every LLM request/response pair of a run in a compact
+JSON Lines file, keyed by a hash of the model and prompt. Replaying a
+cassette answers the same prompts without Ollama (zero network), which
+makes chunking, scheduling and journaling changes cheap to profile and
+regression-test.
+
+File format (one line per request):
+    {"h": "<prompt hash>", "r": "<response text>", "t": <latency seconds>}
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode when a prompt was never recorded."""
+
+
+def prompt_hash(model: str, prompt: str) -> str:
+    """Stable short hash identifying a (model, prompt) request."""
+    digest = hashlib.sha256(f"{model}\0{prompt}".encode("utf-8"))
+    return digest.hexdigest()[:20]
+
+
+class Cassette:
+    """Records or replays LLM responses keyed by prompt hash.
+
+    The same prompt may be sent several times (e.g. retries after a parse
+    error), so each hash keeps its responses in recording order and replay
+    returns them in that order, repeating the last one once exhausted.
+    """
+
+    def __init__(self, path: Path, mode: str, simulate_latency: bool = False):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self._entries: dict[str, list[tuple[str, float]]] = {}
+        self._cursor: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == REPLAY:
+            self._load()
+        else:
+            # Start a fresh cassette so replay order matches this run only
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._entries.values())
+
+    def _load(self) -> None:
+        """Load all recorded responses from the cassette file."""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry["h"], []).append((entry["r"], entry.get("t", 0.0)))
+
+    def record(self, model: str, prompt: str, response: str, latency: float) -> None:
+        """Append a request/response pair to the cassette file."""
+        key = prompt_hash(model, prompt)
+        line = json.dumps({"h": key, "r": response, "t": round(latency, 3)}, ensure_ascii=False)
+        with self._lock:
+            self._entries.setdefault(key, []).append((response, latency))
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def replay(self, model: str, prompt: str) -> str:
+        """Return the recorded response for a prompt, optionally sleeping for its latency."""
+        key = prompt_hash(model, prompt)
+        with self._lock:
+            responses = self._entries.get(key)
+            if not responses:
+                raise CassetteMissError(f"No recorded response for prompt {key} in {self.path.name}")
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            response, latency = responses[min(index, len(responses) - 1)]
+
+        if self.simulate_latency:
+            time.sleep(latency)
+        return response
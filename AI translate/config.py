@@ -26,9 +26,50 @@ MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds between retries
 DELAY_BETWEEN_CHUNKS = 0.5  # seconds between API calls
 PARALLEL_WORKERS = 4  # Number of parallel translation threads (1 = sequential)
+IN_FLIGHT_PER_WORKER = 2  # Chunks queued per worker; more are submitted only as chunks finish
+COMPACT_PROMPT = False  # Minified JSON + aliased keys to cut prompt tokens (generic LLMs only)
+
+# Translation memory (fuzzy reuse of existing translations)
+TM_NGRAM = 3  # Character n-gram size used for similarity
+TM_REUSE_THRESHOLD = 0.97  # Reuse an existing translation directly at or above this similarity
+TM_EXAMPLE_THRESHOLD = 0.5  # Inject matches at or above this similarity as prompt examples
+TM_MAX_EXAMPLES = 5  # Max reference translations injected per chunk
+
+# Glossary / termbase (consistent terminology across chunks)
+GLOSSARY_DIR = "termbase"  # Per-locale termbase files <locale>.json (relative to this folder)
+MUSCLES_CONSTANTS_FILE = "app/constants/muscles.constants.ts"  # Muscle groups added to the glossary
+GLOSSARY_TERMS = [
+    "workout", "exercise", "sets", "reps", "weight", "volume", "rest timer",
+    "superset", "drop set", "rest-pause", "myo-reps", "muscle group", "muscle tag",
+    "body part", "heat map", "personal record", "warm-up", "template",
+]
+GLOSSARY_EXCLUDED_TERMS = {"back"}  # Muscle groups that are also common UI words ("Go back")
+# Acronyms the glossary asks every locale to keep as written, and flags when dropped
+GLOSSARY_KEEP_TERMS = ["RPE", "1RM", "CSV", "JSON", "PDF", "URL", "API"]
+# Values allowed to stay identical to English (find_identical_values.py); words
+# such as "ok" or "pro" may still be translated, so they are not glossary terms
+KNOWN_IDENTICAL_TERMS = {
+    "ok", "ai", "rpe", "1rm", "ui", "csv", "json", "obsidian",
+    "pdf", "url", "id", "api", "pro", "beta"
+}
+
+# Per-locale model routing (--auto-route), learned from the run history
+ROUTING_MAX_RETRY_RATE = 0.15  # Max retries per request for a model to qualify for a locale
+ROUTING_MAX_FAILURE_RATE = 0.02  # Max failed requests (originals kept) per request
+ROUTING_MAX_MISMATCH_RATE = 0.05  # Max glossary term mismatches per translated key
+ROUTING_MIN_KEYS = 20  # Keys a (locale, model, workers) must have translated before it is trusted
+# Manual overrides, always used as-is, e.g. {"ja": {"model": "qwen3:32b", "workers": 2}}
+MODEL_ROUTES: dict[str, dict] = {}
+
+# Watch mode (--watch)
+WATCH_POLL_INTERVAL = 0.5  # seconds between checks of the source file
+WATCH_DEBOUNCE = 1.5  # seconds the source file must stay unchanged before translating
+WATCH_KEEP_ALIVE = "24h"  # Ollama keep_alive while watching, so the model stays loaded between edits
 
 # Paths (relative to project root)
 LOCALES_DIR = "app/i18n/locales"
+HISTORY_FILE = ".translate_history.jsonl"  # Run history used by dry-run estimates (relative to this folder)
+RESUME_FILE = ".translate_resume.json"  # Resume point of an interrupted run (relative to this folder)
 SOURCE_LOCALE = "en"
 
 # Language name mappings for locale codes
@@ -23,12 +23,7 @@ from orchestrator import (
     save_json,
 )
 from json_helpers import flatten_json, unflatten_json
-from config import LOCALES_DIR
-
-KNOWN_IDENTICAL_TERMS = {
-    "ok", "ai", "rpe", "1rm", "ui", "csv", "json", "obsidian", 
-    "pdf", "url", "id", "api", "pro", "beta"
-}
+from config import KNOWN_IDENTICAL_TERMS, LOCALES_DIR
 
 def is_ignored(value: str) -> bool:
     """
@@ -74,7 +69,8 @@ def process_locale(locale: str, source_flat: dict, locales_dir, auto_delete: boo
     identical_keys = []
     for k, v in target_flat.items():
         if k in source_flat and target_flat[k] == source_flat[k]:
-            if not is_ignored(v):
+            # Non-string values (numbers, lists) are never translated
+            if isinstance(v, str) and not is_ignored(v):
                 identical_keys.append((k, v))
             
     if not identical_keys:
@@ -135,7 +131,7 @@ def process_locale(locale: str, source_flat: dict, locales_dir, auto_delete: boo
             del target_flat[k]
             
         # Unflatten and save
-        updated_target = unflatten_json(target_flat)
+        updated_target = unflatten_json(target_flat, source_order=True)
         save_json(target_file, updated_target)
         print(f"✅ [{locale}] Saved changes.")
     else:
@@ -0,0 +1,203 @@
+"""
+Glossary (termbase) support for the AI Translation Tool.
+
+Fitness terms, muscle groups and acronyms are translated once per locale
+and stored in termbase/<locale>.json. Each chunk prompt then only carries
+the glossary entries that actually occur in the chunk, found with an
+Aho-Corasick index over the source values, and translations are checked
+afterwards for terms that did not use their glossary translation.
+"""
+
+import json
+import re
+from collections import deque
+from pathlib import Path
+
+from config import (
+    GLOSSARY_DIR,
+    GLOSSARY_EXCLUDED_TERMS,
+    GLOSSARY_KEEP_TERMS,
+    GLOSSARY_TERMS,
+    MUSCLES_CONSTANTS_FILE,
+)
+
+
+class TermIndex:
+    """Aho-Corasick automaton matching many lowercase terms in one pass."""
+
+    def __init__(self, terms):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+        for term in terms:
+            self._add(term.lower())
+        self._build_fail_links()
+
+    def _add(self, term: str) -> None:
+        node = 0
+        for char in term:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(term)
+
+    def _build_fail_links(self) -> None:
+        # Breadth-first, so a node's failure target is always finished first;
+        # depth-1 nodes keep failing to the root
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> dict[str, str]:
+        """Return {term: occurrence as written in text} for whole-word matches.
+
+        Overlapping matches resolve leftmost-longest ("drop set" wins over
+        "set"), and a trailing plural 's' is accepted ("rear delt" matches "rear delts").
+        """
+        lowered = text.lower()
+        spans = []
+        node = 0
+        for end, char in enumerate(lowered, 1):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for term in self._out[node]:
+                start = end - len(term)
+                stop = end + 1 if lowered[end:end + 1] == "s" else end
+                if _is_boundary(lowered, start - 1) and _is_boundary(lowered, stop):
+                    spans.append((start, -end, term))
+
+        found: dict[str, str] = {}
+        covered = 0
+        for start, neg_end, term in sorted(spans):
+            if start >= covered:
+                found.setdefault(term, text[start:-neg_end])
+                covered = -neg_end
+        return found
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """True if text[index] is outside the string or not a word character."""
+    return index < 0 or index >= len(text) or not (text[index].isalnum() or text[index] == "_")
+
+
+def muscle_group_terms(project_root: Path) -> list[str]:
+    """English muscle group names from CANONICAL_MUSCLE_GROUPS ('rear_delts' -> 'rear delts')."""
+    path = project_root / MUSCLES_CONSTANTS_FILE
+    if not path.exists():
+        return []
+    source = path.read_text(encoding="utf-8")
+    match = re.search(r"CANONICAL_MUSCLE_GROUPS\s*=\s*\[(.*?)\]", source, re.S)
+    if not match:
+        return []
+    return [name.replace("_", " ") for name in re.findall(r'"([^"]+)"', match.group(1))]
+
+
+def source_terms(project_root: Path) -> list[str]:
+    """All English glossary terms to translate (lowercase, deduplicated)."""
+    terms = [*GLOSSARY_TERMS, *muscle_group_terms(project_root)]
+    return [term for term in dict.fromkeys(t.lower() for t in terms) if term not in GLOSSARY_EXCLUDED_TERMS]
+
+
+def _stem_matches(expected: str, translated: str) -> bool:
+    """Loose check that a glossary translation appears in a translated value.
+
+    Words are compared by prefix so inflected forms (plural, case endings)
+    still count; scripts without spaces fall back to a substring check.
+    """
+    translated = translated.lower()
+    for word in expected.lower().split():
+        stem = word[:max(3, len(word) - 2)]
+        if stem not in translated:
+            return False
+    return True
+
+
+class Glossary:
+    """A locale's termbase plus the index used to find terms in chunks."""
+
+    def __init__(self, entries: dict[str, str], keep_terms=GLOSSARY_KEEP_TERMS):
+        # term -> translation; keep terms map to None (left as written in the source)
+        self.entries: dict[str, str | None] = {**entries, **{t.lower(): None for t in keep_terms}}
+        self.index = TermIndex(self.entries)
+        # Termbase chunk still to be translated (dry runs only)
+        self.pending: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def path(locale: str) -> Path:
+        return Path(__file__).parent / GLOSSARY_DIR / f"{locale}.json"
+
+    @classmethod
+    def load(cls, translator, project_root: Path, locale: str, lang_name: str,
+             translate_missing: bool = True) -> "Glossary":
+        """Load a locale's termbase, translating (once) any terms it lacks.
+
+        Without `translate_missing` (dry runs), missing terms stand in for
+        their own translation and are listed in `pending` as the termbase
+        chunk a real run would send first.
+        """
+        path = cls.path(locale)
+        entries: dict[str, str] = {}
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+
+        missing = [term for term in source_terms(project_root) if term not in entries]
+        chunk = {f"fitnessGlossary.{re.sub(r'[^a-z0-9]+', '_', term)}": term for term in missing}
+        if not translate_missing:
+            glossary = cls({**entries, **{term: term for term in missing}})
+            glossary.pending = chunk
+            return glossary
+
+        if missing:
+            print(f"  📖 Translating {len(missing)} glossary terms into the {locale} termbase...")
+            failures = translator.stats.failures
+            result = translator.translate_chunk(chunk, lang_name)
+            # A failed request returns the English originals. Only then are
+            # unchanged values ambiguous; they are dropped and retried next run.
+            # Otherwise terms kept in English ("volume") are stored like any other.
+            failed = translator.stats.failures > failures
+            entries.update({
+                term: result[key] for key, term in chunk.items()
+                if not failed or result[key] != term
+            })
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(dict(sorted(entries.items())), f, ensure_ascii=False, indent=2)
+                f.write("\n")
+        return cls(entries)
+
+    def for_chunk(self, chunk: dict[str, str]) -> dict[str, str]:
+        """Glossary entries occurring in a chunk: {term as written: translation}."""
+        found: dict[str, str] = {}
+        for value in chunk.values():
+            for term, written in self.index.find(value).items():
+                found.setdefault(term, written)
+        return {
+            written: written if self.entries[term] is None else self.entries[term]
+            for term, written in found.items()
+        }
+
+    def mismatches(self, source: str, translated: str) -> list[str]:
+        """Terms of `source` whose glossary translation is missing from `translated`."""
+        missing = []
+        for term, written in self.index.find(source).items():
+            expected = self.entries[term]
+            if not _stem_matches(written if expected is None else expected, translated):
+                missing.append(written)
+        return missing
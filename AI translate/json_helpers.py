@@ -5,36 +5,152 @@ Functions for flattening, unflattening, and chunking JSON structures
 used in the translation pipeline.
 """
 
+import threading
 
-def flatten_json(obj: dict, prefix: str = "") -> dict[str, str]:
+
+class KeyPathTable:
+    """Dot-notation key paths shared by every catalog in the process.
+
+    Each distinct path is stored once, in a tree of per-parent child maps.
+    All flattened locales reference the same key objects, so a locale only
+    adds its values. The tree keeps first-seen order, and since the source
+    locale is flattened first, walking it gives the source key order.
+    Paths are plain dot-joined strings, split on dots by unflatten_json, so
+    {"x.y": {"z": 1}} and {"x": {"y": {"z": 1}}} share the path "x.y.z".
+
+    Watch mode flattens on the main thread while its worker unflattens, so
+    every access to the tree holds `lock` (flatten_json holds it for the
+    whole call).
+    """
+
+    def __init__(self):
+        self._children: dict[str, dict[str, str]] = {}
+        self._order: dict[str, int] = {}
+        self._order_stale = False
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self.lock:
+            self._refresh_order()
+            return len(self._order)
+
+    def children(self, parent: str) -> dict[str, str]:
+        """Map of part -> shared path for the known children of `parent`."""
+        with self.lock:
+            children = self._children.get(parent)
+            if children is None:
+                children = self._children[parent] = {}
+            return children
+
+    def child(self, parent: str, part: str) -> str:
+        """Return the shared path of `part` under `parent` ("" for the root)."""
+        with self.lock:
+            children = self.children(parent)
+            key = children.get(part)
+            if key is None:
+                key = children[part] = f"{parent}.{part}" if parent else part
+                self._order_stale = True
+            return key
+
+    def order(self, key: str) -> int:
+        """Position of a path in first-seen order (unseen paths are added last)."""
+        with self.lock:
+            self._refresh_order()
+            order = self._order.get(key)
+            if order is None:
+                parent = ""
+                for part in key.split("."):
+                    parent = self.child(parent, part)
+                self._refresh_order()
+                order = self._order[key]
+            return order
+
+    def _refresh_order(self) -> None:
+        """Number the paths depth-first through the tree, once per batch of new paths.
+
+        Callers hold `lock`.
+        """
+        if not self._order_stale:
+            return
+        order: dict[str, int] = {}
+        stack = [iter(self._children.get("", {}).values())]
+        while stack:
+            for key in stack[-1]:
+                if key in order:
+                    continue
+                order[key] = len(order)
+                children = self._children.get(key)
+                if children:
+                    stack.append(iter(children.values()))
+                    break
+            else:
+                stack.pop()
+        self._order = order
+        self._order_stale = False
+
+
+KEY_PATHS = KeyPathTable()
+
+
+def flatten_json(obj: dict, prefix: str = "") -> dict[str, object]:
     """Flatten nested JSON into dot-notation key-value pairs.
 
     Example:
         {"modal": {"titles": {"create": "Create"}}}
         => {"modal.titles.create": "Create"}
+
+    Iterative and order-preserving. Leaf values (strings, numbers, lists,
+    empty objects...) are kept as-is so unflatten_json round-trips them.
     """
-    items: dict[str, str] = {}
-    for key, value in obj.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            items.update(flatten_json(value, full_key))
-        else:
-            items[full_key] = str(value)
+    items: dict[str, object] = {}
+    children = KEY_PATHS.children
+    added = False
+    with KEY_PATHS.lock:
+        stack = [(prefix, children(prefix), iter(obj.items()))]
+        while stack:
+            parent, known, entries = stack[-1]
+            for key, value in entries:
+                full_key = known.get(key)
+                if full_key is None:
+                    # First sighting of this path (KeyPathTable.child, inlined for the first pass)
+                    full_key = known[key] = f"{parent}.{key}" if parent else key
+                    added = True
+                if isinstance(value, dict) and value:
+                    stack.append((full_key, children(full_key), iter(value.items())))
+                    break
+                items[full_key] = value
+            else:
+                stack.pop()
+        if added:
+            KEY_PATHS._order_stale = True
     return items
 
 
-def unflatten_json(flat: dict[str, str]) -> dict:
-    """Reconstruct nested JSON from dot-notation key-value pairs."""
+def unflatten_json(flat: dict[str, object], source_order: bool = False) -> dict:
+    """Reconstruct nested JSON from dot-notation key-value pairs.
+
+    With `source_order`, keys are laid out in the order they were first
+    flattened (the source locale's order) instead of the order of `flat`.
+    """
+    keys = flat
+    if source_order:
+        with KEY_PATHS.lock:
+            keys = sorted(flat, key=KEY_PATHS.order)
     result: dict = {}
-    for key, value in flat.items():
+    for key in keys:
         parts = key.split(".")
         current = result
         for part in parts[:-1]:
             current = current.setdefault(part, {})
-        current[parts[-1]] = value
+        current[parts[-1]] = flat[key]
     return result
 
 
+def string_values(flat: dict[str, object]) -> dict[str, str]:
+    """Keep only the string values of a flattened catalog (the translatable ones)."""
+    return {k: v for k, v in flat.items() if isinstance(v, str)}
+
+
 def chunk_dict(d: dict[str, str], size: int) -> list[dict[str, str]]:
     """Split a dictionary into chunks, trying to group keys by prefix for context.
     
@@ -6,22 +6,62 @@ workflow that coordinates the Translator with the file system.
 """
 
 import json
+import os
+import signal
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
+from cassette import CassetteMissError
 from config import (
     CHUNK_SIZE,
     DELAY_BETWEEN_CHUNKS,
+    IN_FLIGHT_PER_WORKER,
     LANGUAGE_NAMES,
     PARALLEL_WORKERS,
     SOURCE_LOCALE,
 )
-from json_helpers import chunk_dict, flatten_json, unflatten_json
+from glossary import Glossary
+from json_helpers import chunk_dict, flatten_json, string_values, unflatten_json
+from run_history import Estimate, Throughput, append_run
+from translation_memory import TranslationMemory
 from translator import Translator
 
 
+# Set by the first Ctrl-C: finish in-flight chunks, submit no new ones
+STOP_REQUESTED = threading.Event()
+
+
+class TranslationInterrupted(Exception):
+    """Raised when a locale stops early on request, after its progress was saved."""
+
+    def __init__(self, locale: str, done_keys: list[str], chunks_done: int, chunks_total: int,
+                 aborted: bool = False):
+        super().__init__(f"{locale}: stopped after {chunks_done}/{chunks_total} chunks")
+        self.locale = locale
+        self.done_keys = done_keys
+        self.chunks_done = chunks_done
+        self.chunks_total = chunks_total
+        # True when in-flight chunks were abandoned (second Ctrl-C)
+        self.aborted = aborted
+
+
+def install_interrupt_handler() -> None:
+    """Make the first Ctrl-C a graceful stop and the second one a hard abort."""
+
+    def handle_sigint(signum, frame):
+        if STOP_REQUESTED.is_set():
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            raise KeyboardInterrupt
+        STOP_REQUESTED.set()
+        print("\n⏸️  Stopping: finishing in-flight chunks (Ctrl-C again to abort now)...",
+              flush=True)
+
+    signal.signal(signal.SIGINT, handle_sigint)
+
+
 def get_project_root() -> Path:
     """Get the project root (parent of 'AI translate' folder)."""
     return Path(__file__).parent.parent
@@ -34,10 +74,18 @@ def load_json(filepath: Path) -> dict:
 
 
 def save_json(filepath: Path, data: dict) -> None:
-    """Save data to a JSON file with pretty formatting."""
-    with open(filepath, "w", encoding="utf-8") as f:
+    """Save data to a JSON file with pretty formatting.
+
+    Writes a temporary file and renames it over the target, so an
+    interrupted save never leaves a truncated file behind.
+    """
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
         f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
 
 
 def get_target_locales(locales_dir: Path, specific_locale: str | None = None) -> list[str]:
@@ -68,11 +116,27 @@ def translate_locale(
     force: bool = False,
     chunk_size: int = CHUNK_SIZE,
     workers: int = PARALLEL_WORKERS,
-) -> None:
-    """Translate the source locale into a target locale."""
+    use_memory: bool = True,
+    resume_keys: list[str] | None = None,
+    use_glossary: bool = True,
+) -> Estimate | None:
+    """Translate the source locale into a target locale.
+
+    In dry-run mode nothing is translated; the projected cost of the run is
+    printed and returned instead. `resume_keys` are keys an interrupted run
+    already saved to the target file; they are kept instead of re-translated.
+    With `use_glossary`, the locale's termbase is loaded (translating missing
+    terms once, except in dry runs) and injected into the chunks using it.
+    Raises TranslationInterrupted if a stop was requested before or during
+    the locale.
+    """
     lang_name = LANGUAGE_NAMES.get(locale, locale)
     target_file = locales_dir / f"{locale}.json"
 
+    if STOP_REQUESTED.is_set() and not dry_run:
+        # Ctrl-C landed after the previous locale's last chunk: start nothing new
+        raise TranslationInterrupted(locale, list(resume_keys or ()), 0, 0)
+
     print(f"\n{'='*60}")
     print(f"🌍 Translating to {lang_name} ({locale})")
     print(f"{'='*60}")
@@ -89,13 +153,41 @@ def translate_locale(
         }
         if not keys_to_translate:
             print(f"  ✅ All {len(source_flat)} keys already translated, skipping.")
-            return
+            return Estimate() if dry_run else None
         print(f"  📝 {len(keys_to_translate)} missing keys to translate "
               f"({len(existing_flat)} already translated)")
     else:
         keys_to_translate = source_flat.copy()
         print(f"  📝 {len(keys_to_translate)} keys to translate")
 
+    # Fuzzy translation memory over existing translations (ignored with --force,
+    # which asks for fresh translations)
+    memory = TranslationMemory()
+    if use_memory and not force:
+        memory = TranslationMemory.from_locale(source_flat, existing_flat)
+
+    resumed = {k: existing_flat[k] for k in resume_keys or () if k in existing_flat and k in keys_to_translate}
+    if resumed:
+        keys_to_translate = {k: v for k, v in keys_to_translate.items() if k not in resumed}
+        print(f"  ⏯️  Resuming: {len(resumed)} keys kept from the interrupted run")
+
+    glossary = None
+    if use_glossary:
+        glossary = Glossary.load(translator, get_project_root(), locale, lang_name,
+                                 translate_missing=not dry_run)
+        # Termbase requests are one-off setup, not chunk work: keep them out of
+        # the run history that calibrates estimates and routing
+        translator.take_stats()
+
+    reused, chunks, chunk_hints = _plan_chunks(translator, keys_to_translate, memory, glossary,
+                                               lang_name, chunk_size)
+    # Resumed keys were already taken out of keys_to_translate
+    generated = len(keys_to_translate) - len(reused)
+    copied = len(keys_to_translate) - len(string_values(keys_to_translate))
+    filled = len(reused) - copied
+    reused.update(resumed)
+    requests, est_prompt, est_completion = _plan_tokens(translator, chunks, chunk_hints, lang_name)
+
     if dry_run:
         print(f"  🔍 DRY RUN — would translate {len(keys_to_translate)} keys")
         sample = dict(list(keys_to_translate.items())[:5])
@@ -103,23 +195,250 @@ def translate_locale(
             print(f"     {k}: \"{v}\"")
         if len(keys_to_translate) > 5:
             print(f"     ... and {len(keys_to_translate) - 5} more")
-        return
+        if glossary and glossary.pending:
+            # The real run translates the missing termbase entries first
+            pending = glossary.pending
+            print(f"  📖 Includes {len(pending)} glossary terms to add to the {locale} termbase")
+            requests += translator.request_count(pending)
+            est_prompt += translator.prompt_tokens(pending, lang_name)
+            est_completion += translator.completion_tokens(pending)
+        throughput = Throughput.from_history(translator.model, workers, locale)
+        estimate = _estimate(requests, est_prompt, est_completion, throughput)
+        estimate.keys = generated
+        estimate.reused = filled
+        estimate.copied = copied
+        print_estimate(estimate, throughput, translator.model, workers)
+        if glossary and throughput is None:
+            # Calibrated estimates cover re-checks; raw plan counts do not
+            print("     Not included: glossary re-check requests, sent only for values that miss a term")
+        return estimate
+
+    start = time.time()
+    translated_flat = _run_chunks(translator, chunks, chunk_hints, memory if use_memory else None,
+                                  glossary, lang_name, reused, existing_flat, merge, force,
+                                  target_file, workers)
+    stats = translator.take_stats()
+    if chunks and not translator.replaying:
+        append_run({
+            "model": translator.model,
+            "workers": workers,
+            "locale": locale,
+            "compact": translator.compact,
+            "keys": generated,
+            "chunks": len(chunks),
+            "est_prompt_tokens": est_prompt,
+            "est_completion_tokens": est_completion,
+            "wall_seconds": round(time.time() - start, 2),
+            **stats.as_dict(),
+        })
+
+    final_count = len(existing_flat) + len(translated_flat) if (merge or existing_flat) else len(translated_flat)
+    print(f"  💾 Saved {final_count} keys to {target_file.name}")
+
+
+def update_locale_keys(
+    translator: Translator,
+    source_flat: dict[str, str],
+    changed: dict[str, str],
+    locales_dir: Path,
+    locale: str,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = PARALLEL_WORKERS,
+    use_memory: bool = True,
+    use_glossary: bool = True,
+) -> None:
+    """Translate added or changed source keys into a locale, overwriting them.
+
+    Unlike translate_locale, keys already present in the target are
+    re-translated when they appear in `changed` (their English text moved on).
+    """
+    lang_name = LANGUAGE_NAMES.get(locale, locale)
+    target_file = locales_dir / f"{locale}.json"
+    existing = load_json(target_file) if target_file.exists() else {}
+    existing_flat = flatten_json(existing) if existing else {}
+
+    print(f"\n🌍 {lang_name} ({locale}): {len(changed)} added/changed keys")
+
+    # Stale translations of changed keys must not feed the memory
+    memory = TranslationMemory()
+    if use_memory:
+        current = {k: v for k, v in existing_flat.items() if k not in changed}
+        memory = TranslationMemory.from_locale(source_flat, current)
+    glossary = Glossary.load(translator, get_project_root(), locale, lang_name) if use_glossary else None
+    reused, chunks, chunk_hints = _plan_chunks(translator, changed, memory, glossary,
+                                               lang_name, chunk_size)
+    _run_chunks(translator, chunks, chunk_hints, memory if use_memory else None, glossary,
+                lang_name, reused, existing_flat, True, False, target_file, workers)
+
+
+def _plan_chunks(translator, keys_to_translate, memory, glossary, lang_name, chunk_size):
+    """Fill what the translation memory can and split the rest into chunks.
+
+    Returns (reused translations, chunks, per-chunk prompt hints), where the
+    hints are the translate_chunk keyword arguments of each chunk: memory
+    examples and the glossary entries occurring in it.
+    Non-string values (numbers, lists...) are copied as-is.
+    """
+    strings = string_values(keys_to_translate)
+    reused = {k: v for k, v in keys_to_translate.items() if k not in strings}
+    from_memory = memory.reuse_all(strings)
+    if from_memory:
+        print(f"  ♻️  {len(from_memory)} keys reused from translation memory "
+              f"({len(memory)} entries)")
+    reused.update(from_memory)
+    keys_to_translate = {k: v for k, v in strings.items() if k not in reused}
 
-    # Split into chunks and translate
     chunks = chunk_dict(keys_to_translate, chunk_size)
-    translated_flat: dict[str, str] = {}
+    chunk_hints = [_chunk_hints(chunk, memory, glossary) for chunk in chunks]
+    if glossary:
+        with_terms = sum(1 for hints in chunk_hints if hints["glossary"])
+        print(f"  📖 Glossary: {len(glossary)} terms, used in {with_terms}/{len(chunks)} chunks")
+    _report_prompt_tokens(translator, chunks, chunk_hints, lang_name)
+    return reused, chunks, chunk_hints
+
+
+def _chunk_hints(chunk, memory, glossary):
+    """translate_chunk keyword arguments of a chunk: memory examples and glossary entries."""
+    return {"examples": memory.examples_for(chunk), "glossary": glossary.for_chunk(chunk) if glossary else None}
+
+
+def _refresh_chunk(chunk, memory, glossary, translated_flat):
+    """Re-plan a chunk against the memory as it stands when the chunk is sent.
+
+    Keys that chunks finished earlier in the run made reusable are filled
+    into translated_flat. Returns the remaining chunk and its hints.
+    """
+    filled = memory.reuse_all(chunk)
+    translated_flat.update(filled)
+    chunk = {k: v for k, v in chunk.items() if k not in filled}
+    return chunk, _chunk_hints(chunk, memory, glossary)
+
+
+def _remember(memory, chunk, result):
+    """Add a finished chunk to the memory; values left as the source are skipped."""
+    for key, source in chunk.items():
+        translation = result.get(key)
+        if isinstance(translation, str) and translation != source:
+            memory.add(source, translation)
+
+
+def _run_chunks(translator, chunks, chunk_hints, memory, glossary, lang_name, reused,
+                existing_flat, merge, force, target_file, workers):
+    """Translate a chunk plan, saving progress to the target file as it goes.
+
+    With a `memory`, finished chunks are added to it and each chunk is
+    re-planned against it just before it is sent (None keeps the plan).
+
+    Raises TranslationInterrupted if a stop was requested before all chunks ran.
+    """
+    translated_flat: dict[str, str] = dict(reused)
     total = len(chunks)
 
-    if workers > 1:
-        print(f"  ⚡ Parallel mode: {workers} workers")
-        _translate_parallel(translator, chunks, lang_name, translated_flat, total,
-                            existing_flat, merge, force, target_file)
+    try:
+        if not chunks:
+            _save_progress(existing_flat, translated_flat, merge, force, target_file)
+            done = 0
+        elif workers > 1:
+            print(f"  ⚡ Parallel mode: {workers} workers")
+            done = _translate_parallel(translator, chunks, chunk_hints, memory, glossary, lang_name,
+                                       translated_flat, total, existing_flat, merge, force,
+                                       target_file, workers)
+        else:
+            done = _translate_sequential(translator, chunks, chunk_hints, memory, glossary, lang_name,
+                                         translated_flat, total, existing_flat, merge, force,
+                                         target_file)
+    except KeyboardInterrupt:
+        # Hard abort: every completed chunk was already saved, so record those
+        _save_progress(existing_flat, translated_flat, merge, force, target_file)
+        done = sum(1 for chunk in chunks if chunk.keys() <= translated_flat.keys())
+        raise TranslationInterrupted(target_file.stem, list(translated_flat), done, total,
+                                     aborted=True) from None
+
+    if done < total:
+        raise TranslationInterrupted(target_file.stem, list(translated_flat), done, total)
+    return translated_flat
+
+
+def _plan_tokens(translator, chunks, chunk_hints, lang_name):
+    """Uncalibrated (requests, prompt tokens, completion tokens) of a chunk plan."""
+    requests = sum(translator.request_count(chunk) for chunk in chunks)
+    prompt = sum(translator.prompt_tokens(chunk, lang_name, **hints)
+                 for chunk, hints in zip(chunks, chunk_hints))
+    completion = sum(translator.completion_tokens(chunk) for chunk in chunks)
+    return requests, prompt, completion
+
+
+def _estimate(requests, est_prompt, est_completion, throughput):
+    """Calibrate plan token counts with recorded history and project wall time.
+
+    Recorded token counts include retries and glossary re-checks, so the
+    calibrated counts already cover them; expected_retries is informational.
+    """
+    if throughput is None:
+        return Estimate(requests=requests, prompt_tokens=est_prompt,
+                        completion_tokens=est_completion, seconds=None)
+
+    prompt = round(est_prompt * throughput.prompt_calibration)
+    completion = round(est_completion * throughput.completion_calibration)
+    return Estimate(
+        requests=requests,
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        expected_retries=requests * throughput.retry_rate,
+        seconds=(prompt + completion) / throughput.tokens_per_second,
+    )
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '1h 04m', '3m 12s' or '9s'."""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+
+def print_estimate(estimate: Estimate, throughput: Throughput | None, model: str,
+                   workers: int, indent: str = "  ") -> None:
+    """Print a projected run cost."""
+    print(f"{indent}📊 Estimate: {estimate.requests} requests "
+          f"(+{estimate.expected_retries:.1f} expected retries), "
+          f"≈{estimate.prompt_tokens} prompt + {estimate.completion_tokens} completion tokens")
+    if estimate.reused or estimate.copied:
+        parts = [f"{estimate.keys} keys to generate"]
+        if estimate.reused:
+            parts.append(f"{estimate.reused} filled from memory")
+        if estimate.copied:
+            parts.append(f"{estimate.copied} non-string values copied")
+        print(f"{indent}   {', '.join(parts)}")
+    if estimate.seconds is None:
+        print(f"{indent}   ⏱️  Wall time unknown — no recorded runs of {model} yet")
+    elif throughput is not None:
+        print(f"{indent}   ⏱️  ≈ {format_duration(estimate.seconds)} with {workers} workers "
+              f"({throughput.tokens_per_second:.0f} tok/s over {throughput.runs} recorded runs)")
     else:
-        _translate_sequential(translator, chunks, lang_name, translated_flat, total,
-                              existing_flat, merge, force, target_file)
+        print(f"{indent}   ⏱️  ≈ {format_duration(estimate.seconds)}")
 
-    final_count = len(existing_flat) + len(translated_flat) if (merge or existing_flat) else len(translated_flat)
-    print(f"  💾 Saved {final_count} keys to {target_file.name}")
+
+def _report_prompt_tokens(translator, chunks, chunk_hints, lang_name):
+    """Print the estimated prompt tokens for a chunk plan (verbose vs compact)."""
+    if translator.use_translategemma:
+        tokens = sum(translator.prompt_tokens(chunk, lang_name, **hints)
+                     for chunk, hints in zip(chunks, chunk_hints))
+        print(f"  🧮 Prompt tokens ≈ {tokens}")
+        return
+
+    verbose = sum(translator.prompt_tokens(chunk, lang_name, compact=False, **hints)
+                  for chunk, hints in zip(chunks, chunk_hints))
+    compact = sum(translator.prompt_tokens(chunk, lang_name, compact=True, **hints)
+                  for chunk, hints in zip(chunks, chunk_hints))
+    saved = 100 * (verbose - compact) / verbose if verbose else 0
+    active = "compact" if translator.compact else "verbose"
+    print(f"  🧮 Prompt tokens ≈ {verbose} verbose → {compact} compact "
+          f"(-{saved:.0f}%, using {active})")
 
 
 def _save_progress(existing_flat, translated_flat, merge, force, target_file):
@@ -128,47 +447,139 @@ def _save_progress(existing_flat, translated_flat, merge, force, target_file):
         progress_flat = {**existing_flat, **translated_flat}
     else:
         progress_flat = translated_flat
-    save_json(target_file, unflatten_json(progress_flat))
+    save_json(target_file, unflatten_json(progress_flat, source_order=True))
+
+
+def _translate_checked(translator, chunk, hints, glossary, lang_name):
+    """Translate a chunk, then re-check the values that ignored the glossary.
+
+    Keys whose translation misses a glossary term are sent once more on
+    their own; the retry is kept where it respects more terms. Terms still
+    missing afterwards are reported and counted in the run stats.
+    """
+    result = translator.translate_chunk(chunk, lang_name, **hints)
+    if not glossary or not hints["glossary"]:
+        return result
+
+    def mismatches(key, translated):
+        return glossary.mismatches(chunk[key], translated)
+
+    flagged = {key: chunk[key] for key in chunk if mismatches(key, result[key])}
+    if not flagged:
+        return result
 
+    retried = translator.translate_chunk(flagged, lang_name, glossary=glossary.for_chunk(flagged))
+    for key in flagged:
+        if len(mismatches(key, retried[key])) < len(mismatches(key, result[key])):
+            result[key] = retried[key]
+        missing = mismatches(key, result[key])
+        if missing:
+            translator.stats.add(term_mismatches=len(missing))
+            print(f"\n    ⚠️  {key}: glossary term(s) {', '.join(missing)} not used")
+    return result
 
-def _translate_sequential(translator, chunks, lang_name, translated_flat, total,
-                          existing_flat, merge, force, target_file):
-    """Translate chunks one at a time."""
-    for i, chunk in enumerate(chunks, 1):
+
+def _translate_unless_stopped(translator, chunk, hints, glossary, lang_name):
+    """Pool task: translate a chunk, or return None if a stop came while it was queued.
+
+    A pool thread picks up the next queued chunk as soon as it finishes one,
+    before the main thread can cancel it, so queued chunks check for
+    themselves.
+    """
+    if STOP_REQUESTED.is_set():
+        return None
+    return _translate_checked(translator, chunk, hints, glossary, lang_name)
+
+
+def _translate_sequential(translator, chunks, chunk_hints, memory, glossary, lang_name, translated_flat,
+                          total, existing_flat, merge, force, target_file):
+    """Translate chunks one at a time. Returns the number of completed chunks."""
+    completed = 0
+    for i, (chunk, hints) in enumerate(zip(chunks, chunk_hints), 1):
+        if STOP_REQUESTED.is_set():
+            break
+        if memory is not None:
+            chunk, hints = _refresh_chunk(chunk, memory, glossary, translated_flat)
+        completed += 1
+        if not chunk:
+            print(f"  ♻️  Chunk {i}/{total} filled from memory")
+            _save_progress(existing_flat, translated_flat, merge, force, target_file)
+            continue
         print(f"  🔄 Chunk {i}/{total} ({len(chunk)} keys)...", end=" ", flush=True)
-        result = translator.translate_chunk(chunk, lang_name)
+        result = _translate_checked(translator, chunk, hints, glossary, lang_name)
         translated_flat.update(result)
+        if memory is not None:
+            _remember(memory, chunk, result)
         print("✅")
         _save_progress(existing_flat, translated_flat, merge, force, target_file)
         if i < total:
-            time.sleep(DELAY_BETWEEN_CHUNKS)
+            translator.pause(DELAY_BETWEEN_CHUNKS)
+    return completed
+
 
+def _translate_parallel(translator, chunks, chunk_hints, memory, glossary, lang_name, translated_flat,
+                        total, existing_flat, merge, force, target_file, workers):
+    """Translate chunks in parallel using a thread pool.
 
-def _translate_parallel(translator, chunks, lang_name, translated_flat, total,
-                        existing_flat, merge, force, target_file):
-    """Translate chunks in parallel using a thread pool."""
-    workers = len(chunks)  # will be capped by ThreadPoolExecutor max_workers caller
+    At most IN_FLIGHT_PER_WORKER chunks per worker are queued at a time;
+    the next ones are submitted as earlier ones finish. Once a stop is
+    requested nothing more is submitted and queued chunks are cancelled, so
+    only chunks already running finish. Returns the number of completed chunks.
+    """
     completed = 0
+    window = workers * IN_FLIGHT_PER_WORKER
+    pending = iter(enumerate(chunks))
+    in_flight = {}
 
-    with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-        # Submit all chunks, keeping track of their index for ordered results
-        future_to_idx = {
-            executor.submit(translator.translate_chunk, chunk, lang_name): idx
-            for idx, chunk in enumerate(chunks)
-        }
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            while not STOP_REQUESTED.is_set() and len(in_flight) < window:
+                idx, chunk = next(pending, (None, None))
+                if chunk is None:
+                    break
+                hints = chunk_hints[idx]
+                if memory is not None:
+                    chunk, hints = _refresh_chunk(chunk, memory, glossary, translated_flat)
+                if not chunk:
+                    completed += 1
+                    print(f"  ♻️  Chunk {idx + 1}/{total} filled from memory  "
+                          f"({completed}/{total} completed)")
+                    _save_progress(existing_flat, translated_flat, merge, force, target_file)
+                    continue
+                future = executor.submit(_translate_unless_stopped, translator, chunk,
+                                         hints, glossary, lang_name)
+                in_flight[future] = (idx, chunk)
+            if STOP_REQUESTED.is_set():
+                for future in [f for f in in_flight if f.cancel()]:
+                    del in_flight[future]
+            if not in_flight:
+                break
 
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            completed += 1
-            try:
-                result = future.result()
-                translated_flat.update(result)
-                print(f"  ✅ Chunk {idx + 1}/{total} done  "
-                      f"({completed}/{total} completed)")
-            except Exception as e:
-                print(f"  ❌ Chunk {idx + 1}/{total} failed: {e}")
-                # Use originals for failed chunks
-                translated_flat.update(chunks[idx])
-
-            # Save progress after each completed chunk
-            _save_progress(existing_flat, translated_flat, merge, force, target_file)
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, chunk = in_flight.pop(future)
+                try:
+                    result = future.result()
+                    if result is None:
+                        continue  # picked up after the stop request: skipped
+                    completed += 1
+                    translated_flat.update(result)
+                    if memory is not None:
+                        _remember(memory, chunk, result)
+                    print(f"  ✅ Chunk {idx + 1}/{total} done  "
+                          f"({completed}/{total} completed)")
+                except CassetteMissError:
+                    raise
+                except Exception as e:
+                    completed += 1
+                    print(f"  ❌ Chunk {idx + 1}/{total} failed: {e}")
+                    # Use originals for failed chunks
+                    translated_flat.update(chunk)
+
+                # Save progress after each completed chunk
+                _save_progress(existing_flat, translated_flat, merge, force, target_file)
+    finally:
+        # On a hard abort, drop queued chunks instead of waiting for them
+        executor.shutdown(wait=False, cancel_futures=True)
+    return completed
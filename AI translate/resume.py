@@ -0,0 +1,54 @@
+"""
+Resume journal for the AI Translation Tool.
+
+When a run is interrupted (Ctrl-C), the locale it stopped in, the keys of
+that locale already saved, the locales still to do and the run settings
+are written to RESUME_FILE. `translate.py --resume` continues from there
+without redoing finished chunks.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from config import RESUME_FILE
+
+# Run settings restored by --resume (argparse destinations)
+RESUMED_SETTINGS = ("model", "force", "no_merge", "chunk_size", "workers", "compact", "no_memory",
+                    "no_glossary", "auto_route")
+
+
+def resume_path() -> Path:
+    """Location of the resume journal (inside the tool's folder)."""
+    return Path(__file__).parent / RESUME_FILE
+
+
+def save_resume(settings: dict, locale: str, done_keys: list[str], remaining: list[str]) -> None:
+    """Write the resume point of an interrupted run."""
+    state = {
+        "settings": {name: settings[name] for name in RESUMED_SETTINGS},
+        "locale": locale,
+        "done_keys": done_keys,
+        "locales": [locale, *remaining],
+    }
+    path = resume_path()
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_resume() -> dict | None:
+    """Load the resume journal, if an interrupted run left one."""
+    path = resume_path()
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def clear_resume() -> None:
+    """Remove the resume journal once its run has completed."""
+    resume_path().unlink(missing_ok=True)
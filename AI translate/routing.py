@@ -0,0 +1,158 @@
+"""
+Per-locale model routing for the AI Translation Tool.
+
+Locales do not trade off the same way: a small model may be fast and
+accurate for European languages yet fail parsing and burn retries for
+CJK or Arabic. The run history records, per locale, the model and worker
+count used together with wall time, retries, failures and glossary term
+mismatches; routing picks for each locale the fastest (model, workers)
+that meets the quality bar, unless MODEL_ROUTES overrides it.
+"""
+
+from dataclasses import dataclass
+
+from config import (
+    MODEL_ROUTES,
+    ROUTING_MAX_FAILURE_RATE,
+    ROUTING_MAX_MISMATCH_RATE,
+    ROUTING_MAX_RETRY_RATE,
+    ROUTING_MIN_KEYS,
+)
+from run_history import load_history
+
+
+@dataclass
+class LocaleModelStats:
+    """Recorded performance of one (model, workers) on one locale."""
+
+    model: str
+    workers: int
+    runs: int
+    keys: int
+    keys_per_second: float
+    retry_rate: float
+    failure_rate: float
+    mismatch_rate: float
+
+    @property
+    def label(self) -> str:
+        return f"{self.model} ×{self.workers}"
+
+    def problems(self) -> list[str]:
+        """Reasons this configuration misses the quality bar (empty if it meets it)."""
+        problems = []
+        if self.keys < ROUTING_MIN_KEYS:
+            problems.append(f"only {self.keys} keys recorded")
+        if self.retry_rate > ROUTING_MAX_RETRY_RATE:
+            problems.append(f"{self.retry_rate:.0%} retries")
+        if self.failure_rate > ROUTING_MAX_FAILURE_RATE:
+            problems.append(f"{self.failure_rate:.0%} failures")
+        if self.mismatch_rate > ROUTING_MAX_MISMATCH_RATE:
+            problems.append(f"{self.mismatch_rate:.0%} term mismatches")
+        return problems
+
+    def summary(self) -> str:
+        return (f"{self.label}: {self.keys_per_second:.2f} keys/s, {self.retry_rate:.0%} retries, "
+                f"{self.failure_rate:.0%} failures, {self.mismatch_rate:.0%} term mismatches "
+                f"({self.keys} keys over {self.runs} runs)")
+
+
+@dataclass
+class Route:
+    """The model and worker count a locale is translated with, and why."""
+
+    locale: str
+    model: str
+    workers: int
+    source: str  # "override", "history" or "default"
+    reason: str
+    candidates: list[LocaleModelStats]
+
+
+def locale_stats(records: list[dict]) -> dict[str, list[LocaleModelStats]]:
+    """Aggregate run records per locale and (model, workers)."""
+    grouped: dict[tuple[str, str, int], list[dict]] = {}
+    for record in records:
+        if record.get("wall_seconds", 0) > 0 and record.get("keys"):
+            key = (record["locale"], record["model"], record["workers"])
+            grouped.setdefault(key, []).append(record)
+
+    stats: dict[str, list[LocaleModelStats]] = {}
+    for (locale, model, workers), runs in grouped.items():
+        def total(name: str) -> float:
+            return sum(r.get(name, 0) for r in runs)
+
+        keys = int(total("keys"))
+        first_tries = max(total("requests") - total("retries"), 1)
+        stats.setdefault(locale, []).append(LocaleModelStats(
+            model=model,
+            workers=workers,
+            runs=len(runs),
+            keys=keys,
+            keys_per_second=keys / total("wall_seconds"),
+            retry_rate=total("retries") / first_tries,
+            failure_rate=total("failures") / first_tries,
+            mismatch_rate=total("term_mismatches") / keys,
+        ))
+    for candidates in stats.values():
+        candidates.sort(key=lambda c: c.keys_per_second, reverse=True)
+    return stats
+
+
+def build_routes(locales: list[str], default_model: str, default_workers: int) -> dict[str, Route]:
+    """Route each locale to a model and worker count.
+
+    Manual MODEL_ROUTES entries win; otherwise the fastest recorded
+    configuration meeting the quality bar is used. If none meets it, the
+    one with the fewest retries, failures and mismatches among those with
+    at least ROUTING_MIN_KEYS recorded keys is used; without enough history
+    the defaults are kept.
+    """
+    stats = locale_stats(load_history())
+    routes = {}
+    for locale in locales:
+        candidates = stats.get(locale, [])
+        override = MODEL_ROUTES.get(locale)
+        if override:
+            routes[locale] = Route(locale, override.get("model", default_model),
+                                   override.get("workers", default_workers),
+                                   "override", "manual entry in MODEL_ROUTES", candidates)
+            continue
+        if not candidates:
+            routes[locale] = Route(locale, default_model, default_workers,
+                                   "default", "no recorded runs for this locale", candidates)
+            continue
+
+        qualified = [c for c in candidates if not c.problems()]
+        sampled = [c for c in candidates if c.keys >= ROUTING_MIN_KEYS]
+        if qualified:
+            best = qualified[0]
+            reason = f"fastest meeting the quality bar ({best.keys_per_second:.2f} keys/s)"
+            faster = [c for c in candidates if c.keys_per_second > best.keys_per_second]
+            if faster:
+                reason += "; faster but rejected: " + ", ".join(
+                    f"{c.label} ({', '.join(c.problems())})" for c in faster
+                )
+        elif sampled:
+            best = min(sampled, key=lambda c: c.retry_rate + c.failure_rate + c.mismatch_rate)
+            reason = "none meets the quality bar; fewest retries, failures and mismatches"
+        else:
+            routes[locale] = Route(locale, default_model, default_workers, "default",
+                                   f"no model has {ROUTING_MIN_KEYS}+ recorded keys for this locale",
+                                   candidates)
+            continue
+        routes[locale] = Route(locale, best.model, best.workers, "history", reason, candidates)
+    return routes
+
+
+def print_routing_report(routes: dict[str, Route]) -> None:
+    """Print the chosen route of each locale with the evidence behind it."""
+    print(f"\n{'='*60}")
+    print("🧭 Model routing")
+    print(f"   Quality bar: ≤{ROUTING_MAX_RETRY_RATE:.0%} retries, ≤{ROUTING_MAX_FAILURE_RATE:.0%} failures, "
+          f"≤{ROUTING_MAX_MISMATCH_RATE:.0%} term mismatches, ≥{ROUTING_MIN_KEYS} keys recorded")
+    print(f"{'='*60}")
+    for route in routes.values():
+        print(f"  {route.locale:<6} → {route.model} ×{route.workers}  [{route.source}] {route.reason}")
+        for candidate in route.candidates:
+            print(f"           {candidate.summary()}")
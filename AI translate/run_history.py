@@ -0,0 +1,143 @@
+"""
+Run statistics and history for the AI Translation Tool.
+
+Every real (non dry-run, non replay) locale translation appends a record
+to a JSON Lines history file: model, worker count, requests, retries,
+token counts and wall time. Dry runs use that history to project the
+wall time, requests and retries of a planned run.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+from config import HISTORY_FILE
+
+
+def history_path() -> Path:
+    """Location of the run history file (inside the tool's folder)."""
+    return Path(__file__).parent / HISTORY_FILE
+
+
+@dataclass
+class RunStats:
+    """Thread-safe counters of the LLM work done by a Translator."""
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    term_mismatches: int = 0  # Glossary terms still not respected after the re-check
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counts) -> None:
+        """Increment one or more counters."""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+
+
+@dataclass
+class Estimate:
+    """Projected cost of translating one locale (or a sum of locales)."""
+
+    keys: int = 0
+    reused: int = 0  # Filled from the translation memory
+    copied: int = 0  # Non-string values copied as-is
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    expected_retries: float = 0.0
+    seconds: float | None = 0.0
+
+    def __add__(self, other: "Estimate") -> "Estimate":
+        seconds = None if self.seconds is None or other.seconds is None else self.seconds + other.seconds
+        return Estimate(
+            keys=self.keys + other.keys,
+            reused=self.reused + other.reused,
+            copied=self.copied + other.copied,
+            requests=self.requests + other.requests,
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+            expected_retries=self.expected_retries + other.expected_retries,
+            seconds=seconds,
+        )
+
+
+def append_run(record: dict) -> None:
+    """Append a locale run record to the history file."""
+    record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **record}
+    with open(history_path(), "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def load_history(model: str | None = None) -> list[dict]:
+    """Load run records, optionally only those of one model."""
+    path = history_path()
+    if not path.exists():
+        return []
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if model is None or record.get("model") == model:
+                records.append(record)
+    return records
+
+
+@dataclass
+class Throughput:
+    """Aggregated performance of past runs used to calibrate estimates.
+
+    The calibrations compare all tokens actually sent and received, retries
+    and glossary re-checks included, with the planned first-attempt counts.
+    """
+
+    runs: int
+    tokens_per_second: float
+    retry_rate: float
+    prompt_calibration: float
+    completion_calibration: float
+
+    @classmethod
+    def from_history(cls, model: str, workers: int, locale: str | None = None) -> "Throughput | None":
+        """Aggregate the history closest to a (model, workers, locale) run.
+
+        Prefers records of the same locale and worker count, then the same
+        worker count, then any worker count of the model.
+        """
+        records = [r for r in load_history(model) if r.get("wall_seconds", 0) > 0]
+        for candidates in (
+            [r for r in records if r.get("workers") == workers and r.get("locale") == locale],
+            [r for r in records if r.get("workers") == workers],
+            records,
+        ):
+            if candidates:
+                return cls._aggregate(candidates)
+        return None
+
+    @classmethod
+    def _aggregate(cls, records: list[dict]) -> "Throughput":
+        def total(name: str) -> float:
+            return sum(r.get(name, 0) for r in records)
+
+        tokens = total("prompt_tokens") + total("completion_tokens")
+        return cls(
+            runs=len(records),
+            tokens_per_second=tokens / total("wall_seconds"),
+            retry_rate=total("retries") / max(total("requests") - total("retries"), 1),
+            prompt_calibration=total("prompt_tokens") / max(total("est_prompt_tokens"), 1)
+            if total("est_prompt_tokens") else 1.0,
+            completion_calibration=total("completion_tokens") / max(total("est_completion_tokens"), 1)
+            if total("est_completion_tokens") else 1.0,
+        )
@@ -10,23 +10,49 @@ Usage:
     python translate.py --locale fr              # Translate specific locale
     python translate.py --model qwen3:32b        # Use a different model
     python translate.py --locale it --merge      # Only fill missing keys
-    python translate.py --dry-run                # Preview without writing
+    python translate.py --dry-run                # Preview + projected requests/tokens/wall time
     python translate.py --locale fr --force      # Overwrite existing translations
+    python translate.py --compact                # Compact prompts (fewer input tokens)
+    python translate.py --record run.cassette    # Record all LLM requests/responses
+    python translate.py --replay run.cassette    # Replay a recorded run offline (no Ollama)
+    python translate.py --locale fr --no-memory  # Disable fuzzy translation-memory reuse
+    python translate.py --no-glossary            # Disable the per-locale termbase
+    python translate.py --watch                  # Translate en.json edits live, model kept warm
+    python translate.py --resume                 # Continue a run stopped with Ctrl-C
+    python translate.py --auto-route             # Per-locale model/workers learned from run history
+    python translate.py --routing-report         # Explain the per-locale routing, then exit
 """
 
 import argparse
+import os
 import sys
 import time
+from pathlib import Path
 
-from config import CHUNK_SIZE, DEFAULT_MODEL, LOCALES_DIR, PARALLEL_WORKERS
+from cassette import RECORD, REPLAY, Cassette, CassetteMissError
+from config import (
+    CHUNK_SIZE,
+    COMPACT_PROMPT,
+    DEFAULT_MODEL,
+    LOCALES_DIR,
+    PARALLEL_WORKERS,
+    WATCH_KEEP_ALIVE,
+)
 from json_helpers import flatten_json
 from orchestrator import (
+    TranslationInterrupted,
     get_project_root,
     get_target_locales,
+    install_interrupt_handler,
     load_json,
+    print_estimate,
     translate_locale,
 )
+from resume import clear_resume, load_resume, save_resume
+from routing import build_routes, print_routing_report
+from run_history import Estimate
 from translator import Translator
+from watcher import SourceWatcher
 
 
 def main():
@@ -73,7 +99,82 @@ def main():
         help=f"Number of parallel translation threads (default: {PARALLEL_WORKERS}, 1=sequential)",
     )
 
+    parser.add_argument(
+        "--compact",
+        action=argparse.BooleanOptionalAction,
+        default=COMPACT_PROMPT,
+        help="Use the compact prompt encoding for generic LLMs "
+             f"(minified JSON, aliased keys, short rules; default: {COMPACT_PROMPT})",
+    )
+
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Disable the fuzzy translation memory (direct reuse and prompt examples)",
+    )
+    parser.add_argument(
+        "--no-glossary",
+        action="store_true",
+        help="Disable the per-locale termbase (glossary injection and term checks)",
+    )
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        metavar="CASSETTE",
+        help="Record every LLM request/response to a cassette file",
+    )
+    cassette_group.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        metavar="CASSETTE",
+        help="Replay LLM responses from a cassette file (no Ollama needed)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="When replaying, sleep for each request's recorded latency",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and translate added/changed en.json keys into all locales on save",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last interrupted run with its original settings",
+    )
+    parser.add_argument(
+        "--auto-route",
+        action="store_true",
+        help="Translate each locale with the model and worker count that performed best for it "
+             "in the run history (--model/--workers become the fallback; MODEL_ROUTES overrides)",
+    )
+    parser.add_argument(
+        "--routing-report",
+        action="store_true",
+        help="Print the per-locale routing and the evidence behind it, then exit",
+    )
+
     args = parser.parse_args()
+    if args.watch and args.resume:
+        parser.error("--resume cannot be used with --watch")
+
+    # Continue an interrupted run with its original settings (watch mode
+    # never uses the journal: it always watches the requested locales)
+    resume_state = None if args.watch else load_resume()
+    if args.resume:
+        if resume_state is None:
+            print("❌ No interrupted run to resume")
+            sys.exit(1)
+        for name, value in resume_state["settings"].items():
+            setattr(args, name, value)
+    elif resume_state is not None:
+        print("ℹ️  An interrupted run can be continued with --resume")
+        resume_state = None
 
     # Resolve paths
     project_root = get_project_root()
@@ -93,33 +194,130 @@ def main():
     source_flat = flatten_json(source)
 
     print(f"🔑 Source: {source_file.name} ({len(source_flat)} keys)")
-    print(f"🤖 Model: {args.model}")
+    print(f"🤖 Model: {args.model}" + (" (fallback for unrouted locales)" if args.auto_route else ""))
 
     if args.dry_run:
         print("🔍 DRY RUN MODE — no files will be written")
 
-    # Initialize translator
-    translator = Translator(model=args.model)
+    # Set up record/replay cassette
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, RECORD)
+        print(f"📼 Recording LLM calls to {args.record}")
+    elif args.replay:
+        if not args.replay.exists():
+            print(f"❌ Cassette file not found: {args.replay}")
+            sys.exit(1)
+        cassette = Cassette(args.replay, REPLAY, simulate_latency=args.replay_latency)
+        print(f"📼 Replaying {len(cassette)} recorded responses from {args.replay}")
+
+    # Initialize translator (one per model when locales are routed)
+    def make_translator(model: str) -> Translator:
+        return Translator(
+            model=model,
+            compact=args.compact,
+            cassette=cassette,
+            keep_alive=WATCH_KEEP_ALIVE if args.watch else None,
+        )
+
+    translator = make_translator(args.model)
+    translators = {args.model: translator}
 
     # Get target locales
-    locales = get_target_locales(locales_dir, args.locale)
+    if resume_state is not None:
+        locales = resume_state["locales"]
+    else:
+        locales = get_target_locales(locales_dir, args.locale)
     print(f"🎯 Target locales: {', '.join(locales)}")
 
-    # Translate each locale
-    start_time = time.time()
+    routes = None
+    if (args.auto_route and not args.watch) or args.routing_report:
+        routes = build_routes(locales, args.model, args.workers)
+        print_routing_report(routes)
+        if args.routing_report:
+            return
 
-    for locale in locales:
-        translate_locale(
+    if args.watch:
+        SourceWatcher(
             translator=translator,
-            source_flat=source_flat,
+            source_file=source_file,
             locales_dir=locales_dir,
-            locale=locale,
-            merge=not args.no_merge,
-            dry_run=args.dry_run,
-            force=args.force,
+            locales=locales,
             chunk_size=args.chunk_size,
             workers=args.workers,
-        )
+            use_memory=not args.no_memory,
+            use_glossary=not args.no_glossary,
+        ).run()
+        return
+
+    # Translate each locale
+    start_time = time.time()
+    total_estimate = Estimate()
+    if not args.dry_run:
+        install_interrupt_handler()
+
+    for i, locale in enumerate(locales):
+        resume_keys = None
+        if resume_state is not None and locale == resume_state["locale"]:
+            resume_keys = resume_state["done_keys"]
+        model, workers = args.model, args.workers
+        if routes is not None:
+            model, workers = routes[locale].model, routes[locale].workers
+        if model not in translators:
+            translators[model] = make_translator(model)
+        if routes is not None:
+            print(f"\n🧭 {locale}: {model} ×{workers} ({routes[locale].source})")
+        try:
+            estimate = translate_locale(
+                translator=translators[model],
+                source_flat=source_flat,
+                locales_dir=locales_dir,
+                locale=locale,
+                merge=not args.no_merge,
+                dry_run=args.dry_run,
+                force=args.force,
+                chunk_size=args.chunk_size,
+                workers=workers,
+                use_memory=not args.no_memory,
+                resume_keys=resume_keys,
+                use_glossary=not args.no_glossary,
+            )
+        except (TranslationInterrupted, KeyboardInterrupt) as e:
+            if isinstance(e, KeyboardInterrupt):
+                if args.dry_run:
+                    raise
+                # Second Ctrl-C outside the chunk loop (planning, termbase):
+                # nothing of this locale was saved beyond its resumed keys
+                e = TranslationInterrupted(locale, list(resume_keys or ()), 0, 0, aborted=True)
+            save_resume(vars(args), e.locale, e.done_keys, locales[i + 1:])
+            print(f"\n{'='*60}")
+            if e.chunks_total:
+                print(f"⏸️  Interrupted in {e.locale}: {e.chunks_done}/{e.chunks_total} chunks done, "
+                      f"{len(e.done_keys)} keys saved to {e.locale}.json")
+            else:
+                print(f"⏸️  Interrupted before translating {e.locale}")
+            print(f"   {len(locales) - i - 1} locale(s) not started. "
+                  f"Resume with: python translate.py --resume")
+            print(f"{'='*60}", flush=True)
+            if e.aborted:
+                # Abandon in-flight requests instead of waiting for them at exit
+                os._exit(130)
+            sys.exit(130)
+        except CassetteMissError as e:
+            print(f"\n❌ Replay diverged from the cassette in {locale}: {e}")
+            print("   The run's prompts differ from the recording (settings, source or prompt changes); "
+                  "chunks after the miss were not saved.")
+            sys.exit(1)
+        if estimate is not None:
+            total_estimate += estimate
+
+    if resume_state is not None and not args.dry_run:
+        clear_resume()
+
+    if args.dry_run and len(locales) > 1:
+        print(f"\n{'='*60}")
+        print(f"📊 Projected total for {len(locales)} locales:")
+        print_estimate(total_estimate, None, "the routed models" if routes else args.model, args.workers)
 
     elapsed = time.time() - start_time
     minutes = int(elapsed // 60)
@@ -0,0 +1,159 @@
+"""
+Fuzzy translation memory for the AI Translation Tool.
+
+Indexes previously translated source strings of a locale by character
+n-grams so near-duplicates ("Create log" vs "Create workout log", or the
+same sentence with a different placeholder) can be found quickly:
+  - matches above TM_REUSE_THRESHOLD are reused directly (no LLM call)
+  - weaker matches are injected into the prompt as reference translations
+"""
+
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from config import (
+    TM_EXAMPLE_THRESHOLD,
+    TM_MAX_EXAMPLES,
+    TM_NGRAM,
+    TM_REUSE_THRESHOLD,
+)
+
+PLACEHOLDER_PATTERN = re.compile(r"\{[a-zA-Z0-9_]+\}")
+
+
+def _normalize(text: str) -> tuple[str, list[str]]:
+    """Replace placeholders with '{}' and return them in order of appearance."""
+    placeholders = PLACEHOLDER_PATTERN.findall(text)
+    return PLACEHOLDER_PATTERN.sub("{}", text), placeholders
+
+
+def _ngrams(text: str, n: int) -> set[str]:
+    """Character n-grams of a space-padded string."""
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+@dataclass
+class Match:
+    """A translation memory hit for a query string."""
+
+    score: float
+    source: str
+    translation: str
+
+
+class TranslationMemory:
+    """Character n-gram similarity index over source -> translation pairs.
+
+    Thread-safe: translated chunks are added while a run is in progress.
+    """
+
+    def __init__(self, n: int = TM_NGRAM):
+        self.n = n
+        self._lock = threading.Lock()
+        self._sources: list[str] = []
+        self._translations: list[str] = []
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        self._exact: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    @classmethod
+    def from_locale(cls, source_flat: dict[str, str], target_flat: dict[str, str]) -> "TranslationMemory":
+        """Build a memory from the existing translations of a locale.
+
+        Values identical to the source are skipped: they are usually
+        untranslated leftovers rather than reference translations.
+        """
+        memory = cls()
+        for key, translation in target_flat.items():
+            source = source_flat.get(key)
+            if isinstance(source, str) and isinstance(translation, str) and translation != source:
+                memory.add(source, translation)
+        return memory
+
+    def add(self, source: str, translation: str) -> None:
+        """Index a translated source string."""
+        normalized, _ = _normalize(source)
+        grams = _ngrams(normalized, self.n)
+        with self._lock:
+            if normalized in self._exact:
+                return
+            idx = len(self._sources)
+            self._sources.append(source)
+            self._translations.append(translation)
+            self._gram_counts.append(len(grams))
+            self._exact[normalized] = idx
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(idx)
+
+    def lookup(self, text: str, limit: int = 1, min_score: float = 0.0) -> list[Match]:
+        """Return up to `limit` indexed strings most similar to `text`.
+
+        Similarity is the Jaccard index of the placeholder-normalized
+        character n-gram sets.
+        """
+        normalized, _ = _normalize(text)
+        grams = _ngrams(normalized, self.n)
+        with self._lock:
+            exact = self._exact.get(normalized)
+            if exact is not None and limit == 1:
+                return [Match(1.0, self._sources[exact], self._translations[exact])]
+
+            shared: Counter[int] = Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+
+            matches = []
+            for idx, common in shared.items():
+                score = common / (len(grams) + self._gram_counts[idx] - common)
+                if score >= min_score:
+                    matches.append(Match(score, self._sources[idx], self._translations[idx]))
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:limit]
+
+    def reuse(self, text: str) -> str | None:
+        """Return a directly reusable translation for `text`, if any.
+
+        The match must score at least TM_REUSE_THRESHOLD and use the same
+        number of placeholders; the match's placeholders are renamed to
+        those of `text` in the returned translation.
+        """
+        matches = self.lookup(text, min_score=TM_REUSE_THRESHOLD)
+        if not matches:
+            return None
+        match = matches[0]
+
+        _, wanted = _normalize(text)
+        _, found = _normalize(match.source)
+        if len(wanted) != len(found) or len(set(found)) != len(found):
+            return None
+        renames = dict(zip(found, wanted))
+        return PLACEHOLDER_PATTERN.sub(lambda m: renames.get(m.group(0), m.group(0)), match.translation)
+
+    def reuse_all(self, flat: dict[str, str]) -> dict[str, str]:
+        """Return the keys of `flat` that can be filled directly from memory."""
+        reused = {}
+        for key, value in flat.items():
+            translation = self.reuse(value)
+            if translation is not None:
+                reused[key] = translation
+        return reused
+
+    def examples_for(self, chunk: dict[str, str]) -> dict[str, str]:
+        """Pick reference translations (source -> translation) for a chunk."""
+        best: dict[str, Match] = {}
+        for value in chunk.values():
+            for match in self.lookup(value, limit=2, min_score=TM_EXAMPLE_THRESHOLD):
+                if match.source != value and (
+                    match.source not in best or best[match.source].score < match.score
+                ):
+                    best[match.source] = match
+        top = sorted(best.values(), key=lambda m: m.score, reverse=True)[:TM_MAX_EXAMPLES]
+        return {m.source: m.translation for m in top}
@@ -7,14 +7,23 @@ of i18n key-value pairs using LlamaIndex + Ollama.
 Supports two modes:
   - Generic LLM: sends a JSON array of values, parses JSON array back
   - TranslateGemma: uses the model's specific prompt format, one value at a time
+
+Generic mode can optionally use a compact prompt encoding (minified JSON,
+aliased keys against a per-chunk prefix table, shorter rules block) to cut
+the number of input tokens per request.
+
+All LLM calls can be recorded to / replayed from a cassette (see cassette.py).
 """
 
 import json
+import string
 import time
 
 from llama_index.llms.ollama import Ollama
 
+from cassette import Cassette, CassetteMissError
 from config import (
+    COMPACT_PROMPT,
     DEFAULT_MODEL,
     LANGUAGE_CODES,
     MAX_RETRIES,
@@ -22,6 +31,26 @@ from config import (
     REQUEST_TIMEOUT,
     RETRY_DELAY,
 )
+from glossary import TermIndex
+from run_history import RunStats
+
+# Values the TranslateGemma path copies through without calling the model
+PASSTHROUGH_VALUES = ("+", "-", "×", "~", "★", "◆", "•")
+
+
+def _terms_by_value(glossary: dict[str, str] | None, chunk: dict[str, str]) -> dict[str, dict[str, str]]:
+    """Glossary entries occurring in each value of a chunk (TranslateGemma prompts).
+
+    Terms match as whole words, like Glossary.for_chunk ("id" is not found in "valid").
+    """
+    if not glossary:
+        return {}
+    index = TermIndex(glossary)
+    translations = {term.lower(): translation for term, translation in glossary.items()}
+    return {
+        value: {written: translations[term] for term, written in index.find(value).items()}
+        for value in chunk.values()
+    }
 
 
 def _is_translategemma(model: str) -> bool:
@@ -29,26 +58,144 @@ def _is_translategemma(model: str) -> bool:
     return "translategemma" in model.lower()
 
 
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a prompt (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _prefix_alias(index: int) -> str:
+    """Short alias for the n-th key prefix of a chunk: A..Z, then P26, P27..."""
+    letters = string.ascii_uppercase
+    return letters[index] if index < len(letters) else f"P{index}"
+
+
+def compact_keys(keys: list[str]) -> tuple[dict[str, str], dict[str, str]]:
+    """Alias dotted keys against a shared table of their parent prefixes.
+
+    Example:
+        ["modal.titles.createLog", "modal.titles.editLog", "common.save"]
+        => prefixes {"A": "modal.titles", "B": "common"}
+           aliases  {"A.createLog": "modal.titles.createLog",
+                     "A.editLog": "modal.titles.editLog",
+                     "B.save": "common.save"}
+
+    Top-level keys (no dot) are used as their own alias.
+    """
+    prefix_ids: dict[str, str] = {}
+    aliases: dict[str, str] = {}
+    for key in keys:
+        parent, _, leaf = key.rpartition(".")
+        if not parent:
+            aliases[key] = key
+            continue
+        if parent not in prefix_ids:
+            prefix_ids[parent] = _prefix_alias(len(prefix_ids))
+        aliases[f"{prefix_ids[parent]}.{leaf}"] = key
+    prefixes = {alias: prefix for prefix, alias in prefix_ids.items()}
+    return prefixes, aliases
+
+
 class Translator:
     """Translates i18n JSON files using LlamaIndex + Ollama."""
 
-    def __init__(self, model: str = DEFAULT_MODEL):
-        self.llm = Ollama(
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        compact: bool = COMPACT_PROMPT,
+        cassette: Cassette | None = None,
+        keep_alive: str | None = None,
+    ):
+        self.cassette = cassette
+        self.replaying = cassette is not None and cassette.replaying
+        # Replay answers from the cassette, so no Ollama client is needed
+        ollama_kwargs = {"keep_alive": keep_alive} if keep_alive is not None else {}
+        self.llm = None if self.replaying else Ollama(
             model=model,
             base_url=OLLAMA_BASE_URL,
             request_timeout=REQUEST_TIMEOUT,
             temperature=0.1,
+            **ollama_kwargs,
         )
         self.model = model
         self.use_translategemma = _is_translategemma(model)
+        self.compact = compact
+        self.stats = RunStats()
+
+    def take_stats(self) -> RunStats:
+        """Return the stats gathered so far and start counting afresh."""
+        stats, self.stats = self.stats, RunStats()
+        return stats
+
+    def _complete(self, prompt: str) -> str:
+        """Send a prompt to the LLM (or the cassette) and return the response text."""
+        start = time.perf_counter()
+        raw: dict = {}
+        if self.replaying:
+            text = self.cassette.replay(self.model, prompt)
+        else:
+            response = self.llm.complete(prompt)
+            text = response.text
+            raw = response.raw or {}
+            if self.cassette is not None:
+                self.cassette.record(self.model, prompt, text, time.perf_counter() - start)
+
+        # Ollama reports exact token counts; fall back to estimates otherwise
+        self.stats.add(
+            requests=1,
+            prompt_tokens=raw.get("prompt_eval_count") or estimate_tokens(prompt),
+            completion_tokens=raw.get("eval_count") or estimate_tokens(text),
+            llm_seconds=time.perf_counter() - start,
+        )
+        return text
+
+    def warm_up(self) -> None:
+        """Load the model into Ollama memory with a tiny request."""
+        if self.llm is not None:
+            self.llm.complete("Reply with OK.")
+
+    def pause(self, seconds: float) -> None:
+        """Sleep between requests or retries.
+
+        Skipped when replaying a cassette without simulated latencies, so
+        offline runs finish as fast as possible.
+        """
+        if self.replaying and not self.cassette.simulate_latency:
+            return
+        time.sleep(seconds)
 
     # ------------------------------------------------------------------
     # Generic LLM mode (JSON object in/out)
     # ------------------------------------------------------------------
 
-    def _build_prompt_generic(self, chunk: dict[str, str], target_lang: str) -> str:
+    def _build_prompt_generic(
+        self,
+        chunk: dict[str, str],
+        target_lang: str,
+        examples: dict[str, str] | None = None,
+        glossary: dict[str, str] | None = None,
+    ) -> str:
         """Build the translation prompt for generic LLMs with keys for context."""
         chunk_json = json.dumps(chunk, indent=2, ensure_ascii=False)
+        examples_block = ""
+        if examples:
+            lines = "\n".join(
+                f"- {json.dumps(src, ensure_ascii=False)} → {json.dumps(tgt, ensure_ascii=False)}"
+                for src, tgt in examples.items()
+            )
+            examples_block = f"""
+REFERENCE TRANSLATIONS (existing translations of similar strings; keep wording consistent):
+{lines}
+"""
+        glossary_block = ""
+        if glossary:
+            lines = "\n".join(
+                f"- {json.dumps(src, ensure_ascii=False)} → {json.dumps(tgt, ensure_ascii=False)}"
+                for src, tgt in glossary.items()
+            )
+            glossary_block = f"""
+GLOSSARY (always translate these terms this way; adapt only case/inflection):
+{lines}
+"""
 
         return f"""You are a professional translator specializing in UI localization.
 Translate the following English strings into {target_lang}.
@@ -64,12 +211,90 @@ RULES:
 5. Do NOT add any explanation, markdown, or commentary.
 6. Preserve any emoji at the start of values (e.g., "✅", "❌", "⚠️", "📸").
 7. Ensure the output is valid JSON.
-
+{glossary_block}{examples_block}
 English strings to translate (as JSON):
 {chunk_json}
 
 Respond with ONLY the translated JSON object:"""
 
+    def _build_prompt_compact(
+        self,
+        chunk: dict[str, str],
+        target_lang: str,
+        examples: dict[str, str] | None = None,
+        glossary: dict[str, str] | None = None,
+    ) -> tuple[str, dict[str, str]]:
+        """Build a compact prompt for generic LLMs.
+
+        Returns the prompt and the alias -> original key mapping needed to
+        map the parsed response back onto the chunk keys.
+        """
+        prefixes, aliases = compact_keys(list(chunk.keys()))
+        aliased = {alias: chunk[key] for alias, key in aliases.items()}
+        chunk_json = json.dumps(aliased, ensure_ascii=False, separators=(",", ":"))
+        prefixes_json = json.dumps(prefixes, ensure_ascii=False, separators=(",", ":"))
+        examples_line = ""
+        if examples:
+            examples_json = json.dumps(examples, ensure_ascii=False, separators=(",", ":"))
+            examples_line = f"\nREFERENCE (keep wording consistent):{examples_json}"
+        glossary_line = ""
+        if glossary:
+            glossary_json = json.dumps(glossary, ensure_ascii=False, separators=(",", ":"))
+            glossary_line = f"\nGLOSSARY (always use these term translations):{glossary_json}"
+
+        prompt = f"""Translate these English UI strings into {target_lang}.
+Keys are "<prefix id>.<name>"; PREFIXES maps ids to the key path giving UI context.
+Return ONLY a JSON object with the same keys and translated values. Keep {{placeholders}}, symbols (+ - ★ ◆ • × ~) and leading emoji unchanged. No commentary.
+PREFIXES:{prefixes_json}{glossary_line}{examples_line}
+INPUT:{chunk_json}"""
+        return prompt, aliases
+
+    def prompt_tokens(
+        self,
+        chunk: dict[str, str],
+        target_lang: str,
+        compact: bool | None = None,
+        examples: dict[str, str] | None = None,
+        glossary: dict[str, str] | None = None,
+    ) -> int:
+        """Estimate the input tokens needed to translate a chunk.
+
+        `compact` overrides the translator's own encoding mode, which lets
+        callers compare the verbose and compact encodings of the same chunk.
+        """
+        if compact is None:
+            compact = self.compact
+        if self.use_translategemma:
+            target_code = LANGUAGE_CODES.get(target_lang, "")
+            terms = _terms_by_value(glossary, chunk)
+            return sum(
+                estimate_tokens(self._build_prompt_translategemma(
+                    key, value, target_lang, target_code, terms.get(value)
+                ))
+                for key, value in chunk.items()
+            )
+        if compact:
+            prompt, _ = self._build_prompt_compact(chunk, target_lang, examples, glossary)
+        else:
+            prompt = self._build_prompt_generic(chunk, target_lang, examples, glossary)
+        return estimate_tokens(prompt)
+
+    def request_count(self, chunk: dict[str, str]) -> int:
+        """Number of LLM requests needed to translate a chunk (without retries)."""
+        if self.use_translategemma:
+            return sum(1 for value in chunk.values() if value and value.strip() not in PASSTHROUGH_VALUES)
+        return 1
+
+    def completion_tokens(self, chunk: dict[str, str]) -> int:
+        """Estimate the output tokens of a chunk, assuming output about as long as the input."""
+        if self.use_translategemma:
+            return sum(estimate_tokens(value) for value in chunk.values())
+        if self.compact:
+            _, aliases = compact_keys(list(chunk.keys()))
+            expected = {alias: chunk[key] for alias, key in aliases.items()}
+            return estimate_tokens(json.dumps(expected, ensure_ascii=False, separators=(",", ":")))
+        return estimate_tokens(json.dumps(chunk, indent=2, ensure_ascii=False))
+
     def _parse_response_generic(self, response_text: str, chunk: dict[str, str]) -> dict[str, str] | None:
         """Parse a JSON object response from a generic LLM."""
         text = response_text.strip()
@@ -116,20 +341,27 @@ Respond with ONLY the translated JSON object:"""
     # TranslateGemma mode (plain text, one value at a time)
     # ------------------------------------------------------------------
 
-    def _build_prompt_translategemma(self, key: str, value: str, target_lang: str, target_code: str) -> str:
+    def _build_prompt_translategemma(
+        self, key: str, value: str, target_lang: str, target_code: str, terms: dict[str, str] | None = None
+    ) -> str:
         """Build TranslateGemma's specific prompt format with key context."""
+        terms_rule = ""
+        if terms:
+            pairs = "; ".join(f'"{src}" = "{tgt}"' for src, tgt in terms.items())
+            terms_rule = f"Use these term translations: {pairs}. "
         return (
             f"You are a professional English (en) to {target_lang} ({target_code}) translator specializing in UI localization. "
             f"Context: The key for this UI string is '{key}'. "
             f"Your goal is to accurately convey the meaning and nuances of the original English text "
             f"while adhering to {target_lang} grammar, vocabulary, and cultural sensitivities. "
             f"CRITICAL RULE: Do NOT translate any placeholder tokens enclosed in curly braces (e.g. {{name}}, {{count}}). They must remain exactly as they are in the translated text. "
+            f"{terms_rule}"
             f"Produce only the {target_lang} translation, without any additional explanations or commentary. "
             f"Please translate the following English text into {target_lang}: {value}"
         )
 
     def _translate_chunk_translategemma(
-        self, chunk: dict[str, str], target_lang: str, target_code: str
+        self, chunk: dict[str, str], target_lang: str, target_code: str, glossary: dict[str, str] | None = None
     ) -> dict[str, str]:
         """Translate a chunk using TranslateGemma (one call per value)."""
         import re
@@ -137,10 +369,11 @@ Respond with ONLY the translated JSON object:"""
         
         # Regex to find {variable} patterns
         var_pattern = re.compile(r'\{[a-zA-Z0-9_]+\}')
+        terms = _terms_by_value(glossary, chunk)
 
         for key, value in chunk.items():
             # Skip values that are just symbols/numbers/placeholders
-            if not value or value.strip() in ("+", "-", "×", "~", "★", "◆", "•"):
+            if not value or value.strip() in PASSTHROUGH_VALUES:
                 result[key] = value
                 continue
                 
@@ -151,11 +384,12 @@ Respond with ONLY the translated JSON object:"""
                 # Using a generic marker like [VAR_0] which LLMs usually leave untouched
                 text_to_translate = text_to_translate.replace(var, f"[VAR_{i}]")
 
-            prompt = self._build_prompt_translategemma(key, text_to_translate, target_lang, target_code)
+            prompt = self._build_prompt_translategemma(
+                key, text_to_translate, target_lang, target_code, terms.get(value)
+            )
 
             try:
-                response = self.llm.complete(prompt)
-                translated = response.text.strip()
+                translated = self._complete(prompt).strip()
                 # Remove quotes if the model wraps in them
                 if translated.startswith('"') and translated.endswith('"'):
                     translated = translated[1:-1]
@@ -167,8 +401,12 @@ Respond with ONLY the translated JSON object:"""
                     translated = translated.replace(f"VAR_{i}", var)
                     
                 result[key] = translated
+            except CassetteMissError:
+                # A replay that diverges from its recording must not fall back to originals
+                raise
             except Exception as e:
                 print(f"    ⚠️  Error translating '{key}': {e}, using original")
+                self.stats.add(failures=1)
                 result[key] = value
 
         return result
@@ -178,40 +416,62 @@ Respond with ONLY the translated JSON object:"""
     # ------------------------------------------------------------------
 
     def translate_chunk(
-        self, chunk: dict[str, str], target_lang: str, retry: int = 0
+        self,
+        chunk: dict[str, str],
+        target_lang: str,
+        retry: int = 0,
+        examples: dict[str, str] | None = None,
+        glossary: dict[str, str] | None = None,
     ) -> dict[str, str]:
         """Translate a single chunk of key-value pairs.
 
         Keys are preserved from the source; only values are sent to the LLM.
         Automatically selects the right strategy based on the model.
+        `examples` (source -> translation) are added to generic prompts as
+        reference translations for consistent wording; `glossary` (term ->
+        translation) entries are required term translations.
         """
         if self.use_translategemma:
             target_code = LANGUAGE_CODES.get(target_lang, "")
-            return self._translate_chunk_translategemma(chunk, target_lang, target_code)
+            return self._translate_chunk_translategemma(chunk, target_lang, target_code, glossary)
 
         # Generic LLM path
-        prompt = self._build_prompt_generic(chunk, target_lang)
+        if self.compact:
+            prompt, aliases = self._build_prompt_compact(chunk, target_lang, examples, glossary)
+            expected = {alias: chunk[key] for alias, key in aliases.items()}
+        else:
+            prompt, aliases = self._build_prompt_generic(chunk, target_lang, examples, glossary), None
+            expected = chunk
 
         try:
-            response = self.llm.complete(prompt)
-            translated_dict = self._parse_response_generic(response.text, chunk)
+            response_text = self._complete(prompt)
+            translated_dict = self._parse_response_generic(response_text, expected)
+            if translated_dict is not None and aliases:
+                # Map aliased keys back onto the original dotted keys
+                translated_dict = {aliases[alias]: value for alias, value in translated_dict.items()}
 
             if translated_dict is None:
                 if retry < MAX_RETRIES:
                     print(f"    ⚠️  Parse error, retry {retry + 1}/{MAX_RETRIES}...")
-                    time.sleep(RETRY_DELAY)
-                    return self.translate_chunk(chunk, target_lang, retry + 1)
+                    self.stats.add(retries=1)
+                    self.pause(RETRY_DELAY)
+                    return self.translate_chunk(chunk, target_lang, retry + 1, examples, glossary)
                 else:
                     print(f"    ❌ Failed to parse after {MAX_RETRIES} retries, using originals")
+                    self.stats.add(failures=1)
                     return chunk
 
             return translated_dict
 
+        except CassetteMissError:
+            raise
         except Exception as e:
             if retry < MAX_RETRIES:
                 print(f"    ⚠️  Error: {e}, retry {retry + 1}/{MAX_RETRIES}...")
-                time.sleep(RETRY_DELAY)
-                return self.translate_chunk(chunk, target_lang, retry + 1)
+                self.stats.add(retries=1)
+                self.pause(RETRY_DELAY)
+                return self.translate_chunk(chunk, target_lang, retry + 1, examples, glossary)
             else:
                 print(f"    ❌ Failed after {MAX_RETRIES} retries: {e}")
+                self.stats.add(failures=1)
                 return chunk
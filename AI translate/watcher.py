@@ -0,0 +1,126 @@
+"""
+Watch mode for the AI Translation Tool.
+
+Keeps one Translator (and its Ollama model) warm, polls the source locale
+file, and translates added or changed keys into every target locale in a
+background thread. Bursts of saves are debounced into a single update.
+"""
+
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+
+from config import CHUNK_SIZE, PARALLEL_WORKERS, WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+from json_helpers import flatten_json
+from orchestrator import load_json, update_locale_keys
+from translator import Translator
+
+
+def diff_flat(old: dict[str, str], new: dict[str, str]) -> dict[str, str]:
+    """Return the keys of `new` that were added or whose value changed."""
+    return {k: v for k, v in new.items() if old.get(k) != v}
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SourceWatcher:
+    """Watches the source locale file and translates edits as they land."""
+
+    def __init__(
+        self,
+        translator: Translator,
+        source_file: Path,
+        locales_dir: Path,
+        locales: list[str],
+        chunk_size: int = CHUNK_SIZE,
+        workers: int = PARALLEL_WORKERS,
+        use_memory: bool = True,
+        use_glossary: bool = True,
+        debounce: float = WATCH_DEBOUNCE,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+    ):
+        self.translator = translator
+        self.source_file = source_file
+        self.locales_dir = locales_dir
+        self.locales = locales
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.use_memory = use_memory
+        self.use_glossary = use_glossary
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._pending: queue.Queue[tuple[dict[str, str], dict[str, str]]] = queue.Queue()
+
+    def run(self) -> None:
+        """Poll the source file until interrupted (Ctrl-C)."""
+        last_flat = flatten_json(load_json(self.source_file))
+        last_signature = _file_signature(self.source_file)
+        changed_at: float | None = None
+
+        print("🔥 Warming up model...")
+        self.translator.warm_up()
+        threading.Thread(target=self._worker, daemon=True).start()
+        print(f"👀 Watching {self.source_file.name} ({len(last_flat)} keys) — Ctrl-C to stop")
+
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                signature = _file_signature(self.source_file)
+                if signature != last_signature:
+                    last_signature = signature
+                    changed_at = time.monotonic()
+                    continue
+
+                # Wait until the file has been quiet for the debounce window
+                if changed_at is None or time.monotonic() - changed_at < self.debounce:
+                    continue
+                changed_at = None
+
+                try:
+                    source_flat = flatten_json(load_json(self.source_file))
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"⚠️  Could not read {self.source_file.name}: {e} — waiting for next save")
+                    continue
+
+                changed = diff_flat(last_flat, source_flat)
+                last_flat = source_flat
+                if changed:
+                    print(f"\n✏️  {len(changed)} added/changed keys in {self.source_file.name}")
+                    self._pending.put((source_flat, changed))
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching (completed chunks are already saved).")
+
+    def _worker(self) -> None:
+        """Translate queued changes into every locale, merging queued bursts."""
+        while True:
+            source_flat, changed = self._pending.get()
+            # Fold any updates that queued up while we were busy
+            while not self._pending.empty():
+                source_flat, more = self._pending.get()
+                changed.update(more)
+            # Keys edited again (or deleted) since they were queued use the latest source
+            changed = {k: source_flat[k] for k in changed if k in source_flat}
+            if not changed:
+                continue
+
+            start = time.time()
+            for locale in self.locales:
+                try:
+                    update_locale_keys(
+                        self.translator, source_flat, changed, self.locales_dir, locale,
+                        chunk_size=self.chunk_size, workers=self.workers,
+                        use_memory=self.use_memory, use_glossary=self.use_glossary,
+                    )
+                except Exception as e:
+                    print(f"  ❌ {locale}: {e}")
+            print(f"\n✅ {len(changed)} keys translated into {len(self.locales)} locale(s) "
+                  f"in {time.time() - start:.1f}s — watching...")
@@ -1,70 +1,444 @@
+import argparse
+import json
 import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def analyze_file_lengths(root_dir, top_n=50):
+EXCLUDED_DIRS = {
+    'node_modules', '.git', 'dist', 'build', 'coverage',
+    '__tests__', 'tests', 'test',
+    '.obsidian', '.idea', '.vscode', '__mocks__', '.tmp', '.github'
+}
+
+INCLUDED_EXTENSIONS = {
+    '.ts', '.tsx', '.scss'
+}
+
+# Line counts keyed by relative path, reused while (mtime, size) is unchanged,
+# and line counts of git blobs keyed by SHA (history mode)
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.file_lengths_cache.json')
+READ_BLOCK_SIZE = 1 << 20
+MIN_LINES_REPORTED = 150
+
+
+def count_lines(file_path):
     """
-    Analyzes file lengths (line count) in the given directory, excluding specific folders.
+    Counts lines like iterating over the file would: newlines, plus a final
+    line without a trailing newline. Reads raw bytes in large blocks.
     """
-    
-    excluded_dirs = {
-        'node_modules', '.git', 'dist', 'build', 'coverage', 
-        '__tests__', 'tests', 'test',
-        '.obsidian', '.idea', '.vscode', '__mocks__', '.tmp', '.github'
-    }
-    
-    included_extensions = {
-        '.ts', '.tsx',  '.scss'
-    }
+    lines = 0
+    last_byte = b'\n'
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            lines += block.count(b'\n')
+            last_byte = block[-1:]
+    return lines if last_byte == b'\n' else lines + 1
 
-    file_stats = []
 
-    print(f"Scanning directory: {root_dir}")
-    print(f"Ignoring directories: {', '.join(excluded_dirs)}")
-    print(f"Including extensions: {', '.join(included_extensions)}")
-    print("-" * 50)
+def count_lines_bytes(content):
+    """Same counting rule as count_lines, for in-memory content."""
+    lines = content.count(b'\n')
+    return lines if not content or content.endswith(b'\n') else lines + 1
 
+
+def is_included(rel_path):
+    """Checks extension and excluded directories of a relative path."""
+    parts = rel_path.replace('\\', '/').split('/')
+    if any(part in EXCLUDED_DIRS for part in parts[:-1]):
+        return False
+    return os.path.splitext(parts[-1])[1].lower() in INCLUDED_EXTENSIONS
+
+
+def list_files_walk(root_dir):
+    """Lists candidate files (relative paths) by walking the tree."""
+    files = []
     for dirpath, dirnames, filenames in os.walk(root_dir):
         # Modify dirnames in-place to exclude directories
-        dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
-        
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
         for filename in filenames:
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in included_extensions:
-                file_path = os.path.join(dirpath, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        line_count = sum(1 for _ in f)
-                        # Store relative path for cleaner output
-                        rel_path = os.path.relpath(file_path, root_dir)
-                        file_stats.append((rel_path, line_count))
-                except Exception as e:
-                    print(f"Could not read {file_path}: {e}")
+            if os.path.splitext(filename)[1].lower() in INCLUDED_EXTENSIONS:
+                files.append(os.path.relpath(os.path.join(dirpath, filename), root_dir))
+    return files
+
+
+def list_files_git(root_dir):
+    """Lists tracked and untracked, non-ignored candidate files via git ls-files."""
+    output = subprocess.run(
+        ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+        cwd=root_dir, capture_output=True, check=True,
+    ).stdout
+    paths = {p.decode('utf-8', errors='surrogateescape') for p in output.split(b'\0') if p}
+    return sorted(p for p in paths if is_included(p))
+
+
+def load_cache(cache_file, root_dir):
+    """
+    Loads the cache for root_dir: {'files': {rel_path: [mtime_ns, size, lines]},
+    'blobs': {blob_sha: lines}}.
+    """
+    cache = {'root': os.path.abspath(root_dir), 'files': {}, 'blobs': {}}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return cache
+    if stored.get('root') == cache['root']:
+        cache['files'] = stored.get('files', {})
+        cache['blobs'] = stored.get('blobs', {})
+    return cache
+
+
+def save_cache(cache_file, cache):
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(tmp_file, cache_file)
+
+
+def collect_file_stats(root_dir, use_git=False, use_cache=True, workers=None, cache_file=CACHE_FILE):
+    """
+    Returns ([(rel_path, line_count)], recounted_files). Only files whose
+    (mtime, size) changed since the cached run are read again.
+    """
+    rel_paths = list_files_git(root_dir) if use_git else list_files_walk(root_dir)
+    cache = load_cache(cache_file, root_dir)
+    cached_files = cache['files'] if use_cache else {}
+
+    new_cache = {}
+    file_stats = []
+    to_count = []
+    for rel_path in rel_paths:
+        try:
+            stat = os.stat(os.path.join(root_dir, rel_path))
+        except OSError:
+            # Deleted but still listed by git
+            continue
+        key = [stat.st_mtime_ns, stat.st_size]
+        cached = cached_files.get(rel_path)
+        if cached and cached[:2] == key:
+            new_cache[rel_path] = cached
+            file_stats.append((rel_path, cached[2]))
+        else:
+            to_count.append((rel_path, key))
+
+    def count(item):
+        rel_path, key = item
+        try:
+            return rel_path, key, count_lines(os.path.join(root_dir, rel_path))
+        except OSError as e:
+            print(f"Could not read {rel_path}: {e}", file=sys.stderr)
+            return rel_path, key, None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for rel_path, key, line_count in executor.map(count, to_count):
+            if line_count is None:
+                continue
+            new_cache[rel_path] = key + [line_count]
+            file_stats.append((rel_path, line_count))
+
+    if use_cache:
+        cache['files'] = new_cache
+        save_cache(cache_file, cache)
+
+    return file_stats, len(to_count)
+
+
+def analyze_file_lengths(root_dir, top_n=50, use_git=False, use_cache=True, workers=None,
+                         as_json=False, max_lines=None, min_lines=MIN_LINES_REPORTED):
+    """
+    Analyzes file lengths (line count) in the given directory, excluding specific folders.
+    Returns the files longer than max_lines (empty when no limit is given).
+    """
+    start = time.perf_counter()
+    file_stats, recounted = collect_file_stats(root_dir, use_git, use_cache, workers)
+    elapsed_ms = (time.perf_counter() - start) * 1000
 
     # Sort by line count descending
-    file_stats.sort(key=lambda x: x[1], reverse=True)
+    file_stats.sort(key=lambda x: (-x[1], x[0]))
 
     # Calculate stats
     total_files = len(file_stats)
     total_lines = sum(count for _, count in file_stats)
     avg_lines = total_lines / total_files if total_files > 0 else 0
+    over_limit = [(p, c) for p, c in file_stats if max_lines is not None and c > max_lines]
+
+    if as_json:
+        print(json.dumps({
+            'root': root_dir,
+            'total_files': total_files,
+            'total_lines': total_lines,
+            'average_lines': round(avg_lines, 2),
+            'recounted_files': recounted,
+            'elapsed_ms': round(elapsed_ms, 1),
+            'top_files': [{'path': p, 'lines': c} for p, c in file_stats[:top_n]],
+            'max_lines': max_lines,
+            'over_limit': [{'path': p, 'lines': c} for p, c in over_limit],
+        }, indent=2))
+        return over_limit
+
+    print(f"Scanning directory: {root_dir}")
+    print(f"File list: {'git ls-files' if use_git else 'directory walk'}")
+    print(f"Ignoring directories: {', '.join(sorted(EXCLUDED_DIRS))}")
+    print(f"Including extensions: {', '.join(sorted(INCLUDED_EXTENSIONS))}")
+    print("-" * 50)
 
-    print(f"\nTotal Files Scanned: {total_files}")
+    print(f"\nTotal Files Scanned: {total_files} ({recounted} recounted, {elapsed_ms:.0f} ms)")
     print(f"Total Lines of Code: {total_lines}")
     print(f"Average Lines per File: {avg_lines:.2f}")
     print("\nTop Largest Files:")
     print(f"{'Lines'} | {'File Path'}")
     print("-" * 60)
 
-    for i, (path, count) in enumerate(file_stats[:top_n]):
-        if count < 150:
+    for path, count in file_stats[:top_n]:
+        if count < min_lines:
             break
         print(f"{count} | {path}")
 
+    if over_limit:
+        print(f"\n{len(over_limit)} file(s) exceed {max_lines} lines:")
+        for path, count in over_limit:
+            print(f"{count} | {path}")
+
+    return over_limit
+
+
+def git(root_dir, *args):
+    return subprocess.run(['git', *args], cwd=root_dir, capture_output=True, check=True).stdout
+
+
+def list_blobs(root_dir, rev):
+    """Maps included file paths to blob SHAs in a revision (git ls-tree)."""
+    blobs = {}
+    for entry in git(root_dir, 'ls-tree', '-r', '-z', rev).split(b'\0'):
+        if not entry:
+            continue
+        meta, path = entry.split(b'\t', 1)
+        mode, obj_type, sha = meta.split()
+        path = path.decode('utf-8', errors='surrogateescape')
+        if obj_type == b'blob' and mode.startswith(b'100') and is_included(path):
+            blobs[path] = sha.decode()
+    return blobs
+
+
+def list_history(root_dir, rev_range, max_commits=None):
+    """
+    Returns ([(sha, date)], base, [{path: blob_sha}]) for the first-parent
+    commits of rev_range, oldest first, where base is the {path: blob_sha}
+    tree before the first of them. Trees are rebuilt from a single
+    `git log --raw` instead of listing every revision.
+    """
+    args = ['log', '--reverse', '--first-parent', '--diff-merges=first-parent', '--raw',
+            '--no-renames', '--no-abbrev', '-z', '--format=%x01%H %cs']
+    if max_commits:
+        args.append(f'--max-count={max_commits}')
+    output = git(root_dir, *args, rev_range, '--')
+
+    commits = []
+    snapshots = []
+    base = {}
+    blobs = None
+    for record in output.split(b'\x01')[1:]:
+        fields = record.split(b'\0')
+        sha, date = fields[0].decode().strip().split(' ', 1)
+        if blobs is None:
+            # Start from the parent's tree; the first commit's diff is applied below
+            has_parent = subprocess.run(['git', 'rev-parse', '-q', '--verify', f'{sha}^'],
+                                        cwd=root_dir, capture_output=True).returncode == 0
+            blobs = list_blobs(root_dir, f'{sha}^') if has_parent else {}
+            base = dict(blobs)
+
+        changes = [f.strip() for f in fields[1:]]
+        for meta, path in zip(changes[0::2], changes[1::2]):
+            if not meta.startswith(b':'):
+                continue
+            _, new_mode, _, new_sha, status = meta[1:].split()
+            path = path.decode('utf-8', errors='surrogateescape')
+            if not is_included(path):
+                continue
+            if status == b'D' or not new_mode.startswith(b'100'):
+                blobs.pop(path, None)
+            else:
+                blobs[path] = new_sha.decode()
+
+        commits.append((sha, date))
+        snapshots.append(dict(blobs))
+    return commits, base, snapshots
+
+
+def count_blob_lines(root_dir, shas):
+    """
+    Counts lines of blobs streamed through one `git cat-file --batch` process.
+    Returns {sha: lines}.
+    """
+    if not shas:
+        return {}
+    process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=root_dir,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def feed():
+        # Written from a thread so a full stdout pipe can never block stdin
+        process.stdin.write(''.join(f'{sha}\n' for sha in shas).encode())
+        process.stdin.close()
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    counts = {}
+    for sha in shas:
+        header = process.stdout.readline().split()
+        if len(header) < 3 or header[1] == b'missing':
+            continue
+        content = process.stdout.read(int(header[2]))
+        process.stdout.read(1)  # trailing newline after each object
+        counts[sha] = count_lines_bytes(content)
+    writer.join()
+    process.wait()
+    return counts
+
+
+def analyze_history(root_dir, rev_range, max_commits=None, top_n=50, use_cache=True,
+                    as_json=False, cache_file=CACHE_FILE):
+    """
+    Reports per-file line counts across the commits of rev_range and the
+    files that grew the most, reading blob contents straight from git.
+    """
+    start = time.perf_counter()
+    commits, base, snapshots = list_history(root_dir, rev_range, max_commits)
+
+    cache = load_cache(cache_file, root_dir)
+    blob_lines = cache['blobs'] if use_cache else {}
+    wanted = {sha for snapshot in [base, *snapshots] for sha in snapshot.values()}
+    missing = sorted(wanted - blob_lines.keys())
+    blob_lines.update(count_blob_lines(root_dir, missing))
+    if use_cache:
+        save_cache(cache_file, cache)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # Line count of every file at every commit (None while it does not exist)
+    paths = sorted({path for snapshot in snapshots for path in snapshot})
+    series = {
+        path: [blob_lines.get(snapshot[path]) if path in snapshot else None for snapshot in snapshots]
+        for path in paths
+    }
+
+    growers = []
+    for path, counts in series.items():
+        present = [c for c in counts if c is not None]
+        if counts[-1] is None or not present:
+            continue
+        # Growth is measured from the tree before the range; files added inside it grow from zero
+        first = blob_lines.get(base[path], 0) if path in base else 0
+        growers.append((path, first, counts[-1], counts[-1] - first))
+    growers.sort(key=lambda g: (-g[3], g[0]))
+
+    if as_json:
+        print(json.dumps({
+            'root': root_dir,
+            'range': rev_range,
+            'commits': [{'sha': sha, 'date': date} for sha, date in commits],
+            'blobs_counted': len(missing),
+            'elapsed_ms': round(elapsed_ms, 1),
+            'series': series,
+            'top_growers': [
+                {'path': p, 'first': f, 'last': l, 'growth': g} for p, f, l, g in growers[:top_n]
+            ],
+        }, indent=2))
+        return growers
+
+    if not commits:
+        print(f"No commits in range: {rev_range}")
+        return growers
+
+    print(f"History of {rev_range}: {len(commits)} commits "
+          f"({commits[0][0][:8]} {commits[0][1]} .. {commits[-1][0][:8]} {commits[-1][1]})")
+    print(f"Files tracked: {len(paths)} ({len(missing)} blobs counted, {elapsed_ms:.0f} ms)")
+    print("\nTop Growing Files:")
+    print(f"{'Growth':>7} | {'First':>6} -> {'Last':<6} | {'File Path'}")
+    print("-" * 60)
+    for path, first, last, growth in growers[:top_n]:
+        if growth <= 0:
+            break
+        print(f"{growth:+7d} | {first:>6} -> {last:<6} | {path}")
+    return growers
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report the longest source files (line count).")
+    parser.add_argument('--root', default=None,
+                        help="Directory to scan (default: project root)")
+    parser.add_argument('--top', type=int, default=50,
+                        help="Number of largest files to report (default: 50)")
+    parser.add_argument('--min-lines', type=int, default=None,
+                        help=f"Hide files shorter than this in the text report (default: {MIN_LINES_REPORTED})")
+    parser.add_argument('--git', action='store_true',
+                        help="Take the file list from git ls-files instead of walking the tree")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Recount every file and do not update the line-count cache")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Threads used to count changed files (default: Python's default)")
+    parser.add_argument('--json', action='store_true',
+                        help="Print machine-readable JSON instead of the text report")
+    parser.add_argument('--max-lines', type=int, default=None,
+                        help="Exit with status 1 if any file is longer than this (CI / pre-push gate)")
+    parser.add_argument('--history', metavar='RANGE', default=None,
+                        help="Report line-count growth across a git revision range (e.g. HEAD~200..HEAD)")
+    parser.add_argument('--max-commits', type=int, default=None,
+                        help="With --history, only analyse the most recent N commits of the range")
+    args = parser.parse_args()
+
+    # Options of one mode that the other mode would silently ignore
+    if args.history:
+        ignored = [flag for flag, value in (('--git', args.git), ('--workers', args.workers),
+                                            ('--max-lines', args.max_lines), ('--min-lines', args.min_lines))
+                   if value not in (None, False)]
+        if ignored:
+            parser.error(f"{', '.join(ignored)} cannot be used with --history")
+    elif args.max_commits is not None:
+        parser.error("--max-commits requires --history")
+    if args.min_lines is None:
+        args.min_lines = MIN_LINES_REPORTED
+    return args
+
+
 if __name__ == "__main__":
     # Assumes the script is run from the project root or scripts folder
-    # We want to scan the project root. 
+    # We want to scan the project root.
     # If script is in /path/to/project/scripts/analyze.py, root is ..
-    
+
     current_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(current_dir)
-    
-    analyze_file_lengths(project_root)
+
+    args = parse_args()
+    if args.history:
+        try:
+            analyze_history(
+                args.root or project_root,
+                args.history,
+                max_commits=args.max_commits,
+                top_n=args.top,
+                use_cache=not args.no_cache,
+                as_json=args.json,
+            )
+        except subprocess.CalledProcessError as e:
+            # e.g. a range naming a revision that does not exist
+            print(f"git {e.cmd[1]} failed:", file=sys.stderr)
+            print(e.stderr.decode('utf-8', errors='replace').strip(), file=sys.stderr)
+            sys.exit(2)
+        sys.exit(0)
+
+    over_limit = analyze_file_lengths(
+        args.root or project_root,
+        top_n=args.top,
+        use_git=args.git,
+        use_cache=not args.no_cache,
+        workers=args.workers,
+        as_json=args.json,
+        max_lines=args.max_lines,
+        min_lines=args.min_lines,
+    )
+    sys.exit(1 if over_limit else 0)